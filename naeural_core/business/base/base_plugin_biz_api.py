@@ -116,6 +116,8 @@ class _BasePluginAPIMixin:
     # Auto-cleanup semaphore if configured
     self._semaphore_auto_cleanup()
     self.on_close()
+    # Flush pending chainstore response writes (including any issued by `on_close`)
+    self._chainstore_response_shutdown()
     return
 
   def on_command(self, data, **kwargs):
@@ -55,6 +55,8 @@ Architecture Benefits:
 5. Composability: Can be mixed with other functionality mixins
 6. Simplicity: Single write - no retries, no confirmations
 7. Process Loop Pattern: Like semaphore, checks readiness in _process()
+8. Non-blocking: Writes run on a per-instance background (daemon) worker so
+   the chainstore round-trip never stalls the plugin loop nor the shutdown
 
 Configuration:
 -------------
@@ -70,10 +72,16 @@ Security Considerations:
 
 """
 
+import queue
 import random
+import threading
+
+from concurrent.futures import Future, wait
 
 from naeural_core import constants as ct
 
+_CHAINSTORE_RESPONSE_FLUSH_TIMEOUT = 5
+
 
 class _DeeployChainstoreResponseMixin:
   """
@@ -94,10 +102,19 @@ class _DeeployChainstoreResponseMixin:
 
     State variables:
       - _chainstore_response_sent: Prevents duplicate sends
+      - _chainstore_pending: Futures of response writes not yet completed
+      - __chainstore_closed: Set by `_chainstore_response_shutdown`, after which
+        writes run synchronously in the caller thread
+      - __chainstore_key_cache: Cached (config_data, raw key, key, is_valid) resolution
 
     Note: _is_plugin_ready and set_plugin_ready() are now in _PluginReadinessMixin
     """
     self._chainstore_response_sent = False
+    self._chainstore_pending = set()
+    self.__chainstore_pending_lock = threading.Lock()
+    self.__chainstore_jobs = None
+    self.__chainstore_closed = False
+    self.__chainstore_key_cache = None
     super(_DeeployChainstoreResponseMixin, self).__init__()
     return
 
@@ -126,11 +143,165 @@ class _DeeployChainstoreResponseMixin:
     if not self.is_plugin_ready():
       return
 
-    # Ready - send response
-    if self._send_chainstore_response():
-      self._chainstore_response_sent = True
+    # Ready - send response. The flag is raised before submitting so that a
+    # failed background write (which clears it) is retried on the next loop.
+    self._chainstore_response_sent = True
+    if not self._send_chainstore_response():
+      self._chainstore_response_sent = False
+    return
+
+  def _chainstore_response_submit(self, fn, *args, on_done=None, **kwargs):
+    """
+    Run a chainstore response write on the instance background worker.
+
+    A single worker is used per instance so that a reset and the following
+    send for the same key are applied in submission order. The worker is a
+    daemon thread so a write blocked in `chainstore_set` (e.g. waiting for the
+    chain state) never holds the interpreter at exit. Once
+    `_chainstore_response_shutdown` was called the write runs synchronously
+    in the caller thread instead.
+
+    Parameters
+    ----------
+    fn : callable
+        The write to perform (e.g. `chainstore_set`).
+    on_done : callable, optional
+        Called with the result (or raised exception) once the write completes.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        The future of the submitted write (already completed after shutdown).
+    """
+    def _run():
+      # `on_done` runs inside the job so a completed future implies it was handled
+      try:
+        result = fn(*args, **kwargs)
+      except Exception as exc:
+        result = exc
+      if on_done is not None:
+        on_done(result)
+      return result
+
+    future = Future()
+    with self.__chainstore_pending_lock:
+      run_inline = self.__chainstore_closed
+      if not run_inline:
+        if self.__chainstore_jobs is None:
+          self.__chainstore_jobs = queue.SimpleQueue()
+          threading.Thread(
+            target=self.__chainstore_worker_loop,
+            args=(self.__chainstore_jobs,),
+            name=ct.THREADS_PREFIX + 'chainstore_resp',
+            daemon=True,
+          ).start()
+        self._chainstore_pending.add(future)
+        self.__chainstore_jobs.put((future, _run))
+    if run_inline:
+      future.set_result(_run())
+      return future
+    future.add_done_callback(self.__chainstore_discard_pending)
+    return future
+
+  def __chainstore_worker_loop(self, jobs):
+    while True:
+      job = jobs.get()
+      if job is None:
+        break
+      future, run = job
+      if not future.set_running_or_notify_cancel():
+        continue
+      try:
+        future.set_result(run())
+      except Exception as exc:
+        future.set_exception(exc)
+    return
+
+  def __chainstore_discard_pending(self, future):
+    with self.__chainstore_pending_lock:
+      self._chainstore_pending.discard(future)
     return
 
+  def _chainstore_response_flush(self, timeout=_CHAINSTORE_RESPONSE_FLUSH_TIMEOUT):
+    """
+    Wait for pending chainstore response writes to complete.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Maximum number of seconds to wait.
+
+    Returns
+    -------
+    bool
+        True if no writes are pending anymore, False on timeout.
+    """
+    with self.__chainstore_pending_lock:
+      pending = list(self._chainstore_pending)
+    if len(pending) == 0:
+      return True
+    _, not_done = wait(pending, timeout=timeout)
+    if len(not_done) > 0:
+      self.P(
+        f"{len(not_done)} chainstore response write(s) still pending after {timeout}s",
+        color='y'
+      )
+    return len(not_done) == 0
+
+  def _chainstore_response_shutdown(self, timeout=_CHAINSTORE_RESPONSE_FLUSH_TIMEOUT):
+    """
+    Flush pending chainstore response writes and stop the background worker.
+
+    Called from `_on_close` at plugin shutdown, after `on_close`, so writes
+    issued by the plugin's own close handler are flushed too. The wait is
+    bounded by `timeout`; writes still running afterwards are left to the
+    daemon worker. Any write submitted after this call runs synchronously.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Maximum number of seconds to wait for pending writes.
+    """
+    self._chainstore_response_flush(timeout=timeout)
+    with self.__chainstore_pending_lock:
+      self.__chainstore_closed = True
+      jobs, self.__chainstore_jobs = self.__chainstore_jobs, None
+    if jobs is not None:
+      # the worker drains the writes queued before the sentinel and exits
+      jobs.put(None)
+    return
+
+  def _chainstore_response_resolve(self):
+    """
+    Resolve and validate CHAINSTORE_RESPONSE_KEY once per configuration.
+
+    The result is cached on the identity of `config_data` and of its raw
+    CHAINSTORE_RESPONSE_KEY value: `config_data` may be replaced, but it is
+    also updated in place (`update_config_data`, direct item assignment), which
+    stores a new value object. The key is re-validated (and an invalid key is
+    reported) only when the configuration actually changes.
+
+    Returns:
+        tuple: (response_key, is_valid)
+    """
+    config_data = getattr(self, 'config_data', None)
+    raw_key = None
+    if isinstance(config_data, dict):
+      raw_key = config_data.get('CHAINSTORE_RESPONSE_KEY')
+    cache = self.__chainstore_key_cache
+    if cache is None or cache[0] is not config_data or cache[1] is not raw_key:
+      response_key = getattr(self, 'cfg_chainstore_response_key', None)
+      is_valid = response_key is not None
+      if is_valid and (not isinstance(response_key, str) or len(response_key) == 0):
+        self.P(
+          "CHAINSTORE_RESPONSE_KEY is configured but invalid (must be non-empty string)",
+          color='r'
+        )
+        is_valid = False
+      cache = (config_data, raw_key, response_key, is_valid)
+      self.__chainstore_key_cache = cache
+    return cache[2], cache[3]
+
   def _get_chainstore_response_key(self):
     """
     Get the chainstore response key from configuration.
@@ -141,7 +312,7 @@ class _DeeployChainstoreResponseMixin:
     Returns:
         str or None: The response key if configured, None otherwise.
     """
-    return getattr(self, 'cfg_chainstore_response_key', None)
+    return self._chainstore_response_resolve()[0]
 
   def _get_chainstore_response_data(self):
     """
@@ -239,7 +410,9 @@ class _DeeployChainstoreResponseMixin:
     Returns
     -------
     bool
-        True if reset was performed, False if key not configured.
+        True if the reset write was queued, False if key not configured.
+        The write runs on the background worker, so its outcome is only
+        observed via `_chainstore_response_flush` (or logged once done).
 
     Example
     -------
@@ -263,18 +436,7 @@ class _DeeployChainstoreResponseMixin:
     Returns:
         bool: True if response should be sent, False otherwise.
     """
-    response_key = self._get_chainstore_response_key()
-    if response_key is None:
-      return False
-
-    if not isinstance(response_key, str) or len(response_key) == 0:
-      self.P(
-        "CHAINSTORE_RESPONSE_KEY is configured but invalid (must be non-empty string)",
-        color='r'
-      )
-      return False
-
-    return True
+    return self._chainstore_response_resolve()[1]
 
   def _reset_chainstore_response(self):
     """
@@ -288,7 +450,10 @@ class _DeeployChainstoreResponseMixin:
     the actual response data.
 
     Returns:
-        bool: True if reset was performed, False if key not configured.
+        bool: True if the reset write was queued, False if key not configured.
+        The write runs on the background worker and does not report back
+        through this value: its outcome is logged once done and
+        `_chainstore_response_flush` waits for it to complete.
 
     Example:
         ```python
@@ -306,7 +471,12 @@ class _DeeployChainstoreResponseMixin:
     response_key = self._get_chainstore_response_key()
     # Reset the sent flag to allow re-sending after reset
     self._chainstore_response_sent = False
-    return self._reset_chainstore_response_key(response_key)
+    self._chainstore_response_submit(
+      self._reset_chainstore_response_key,
+      response_key,
+      write_kwargs=self._get_chainstore_response_write_kwargs(),
+    )
+    return True
 
   def _reset_chainstore_response_key(self, response_key, write_kwargs=None):
     """
@@ -499,7 +669,9 @@ class _DeeployChainstoreResponseMixin:
         None
 
     Returns:
-        bool: True if response was sent successfully, False otherwise.
+        bool: True if the write was submitted, False otherwise. The outcome of
+        the write is logged once it completes and a failed write clears
+        `_chainstore_response_sent` so the process loop sends it again.
 
     Example:
         ```python
@@ -509,6 +681,8 @@ class _DeeployChainstoreResponseMixin:
 
     Implementation Notes:
         - Single write (no retries, no confirmations)
+        - Response data and peers are resolved synchronously, only the
+          chainstore_set call runs on the background worker
         - Gracefully handles chainstore_set failures without raising exceptions
         - Call _reset_chainstore_response() at plugin start before calling this
     """
@@ -531,23 +705,34 @@ class _DeeployChainstoreResponseMixin:
       )
       return False
 
+    def _on_send_done(result):
+      if isinstance(result, Exception):
+        self.P(f"Error sending chainstore response: {result}", color='r')
+      elif result:
+        self.P(f"Successfully sent chainstore response to '{response_key}'", color='g')
+        return
+      else:
+        self.P(f"Failed to send chainstore response (chainstore_set returned False)", color='y')
+      self._chainstore_response_sent = False
+      return
+
     # Send single write to chainstore
     try:
-      self.P(f"Setting '{response_key}' to: {self.json_dumps(response_data)}")
+      # The full payload is serialized only when debug logging is enabled
+      if self.check_debug_logging_enabled():
+        self.P(f"Setting '{response_key}' to: {self.json_dumps(response_data)}")
+      else:
+        self.P(f"Setting '{response_key}' ({len(response_data)} fields)")
 
       # Single write - no retries, no confirmations
-      result = self.chainstore_set(
+      self._chainstore_response_submit(
+        self.chainstore_set,
         response_key,
         response_data,
+        on_done=_on_send_done,
         **self._get_chainstore_response_write_kwargs()
       )
-
-      if result:
-        self.P(f"Successfully sent chainstore response to '{response_key}'", color='g')
-        return True
-      else:
-        self.P(f"Failed to send chainstore response (chainstore_set returned False)", color='y')
-        return False
+      return True
 
     except Exception as e:
       self.P(f"Error sending chainstore response: {e}", color='r')
@@ -19,6 +19,7 @@ Consumer plugins (CAR/WAR) use:
   - semaphore_is_ready(): Check if all dependencies are ready
   - semaphore_get_env(): Collect environment variables from dependencies
   - semaphore_get_missing(): Get list of missing semaphores
+  - semaphore_all_ready_fast(): Early-exit readiness check for poll loops
 
 Configuration:
   Provider: SEMAPHORE = "UNIQUE_KEY"
@@ -28,6 +29,30 @@ Configuration:
 from time import time as tm
 
 
+def _new_semaphore_state(instance_id=None, plugin_signature=None):
+  """
+  Build the shared-memory state of one semaphore, stored in `plugins_shmem[SEMAPHORE]`.
+
+  Entries are plain dicts with the public layout paired plugins (CAR/WAR, also
+  outside this repo) read and write directly::
+
+    {'is_ready': bool, 'env': dict,
+     'metadata': {'instance_id', 'plugin_signature', 'ready_timestamp'}}
+
+  Consumers therefore read any entry through `.get` so that every mapping
+  following this layout is accepted.
+  """
+  return {
+    'is_ready': False,
+    'env': {},
+    'metadata': {
+      'instance_id': instance_id,
+      'plugin_signature': plugin_signature,
+      'ready_timestamp': None,
+    },
+  }
+
+
 class _SemaphoredPairedPluginMixin(object):
   """
   Mixin for coordinating startup and environment exchange between paired plugins
@@ -44,6 +69,9 @@ class _SemaphoredPairedPluginMixin(object):
 
     Provider state (for plugins signaling readiness):
       - _semaphore_signaled: Flag to prevent duplicate signaling
+
+    Shared state:
+      - __semaphore_cfg_cache: Cached resolution of SEMAPHORE / SEMAPHORED_KEYS
     """
     # Consumer state (existing - for plugins that wait for others)
     self.__semaphore_wait_start = None
@@ -52,6 +80,9 @@ class _SemaphoredPairedPluginMixin(object):
     # Provider state (new - for plugins that signal they're ready)
     self._semaphore_signaled = False
 
+    # Resolved semaphore config, refreshed whenever `config_data` or its keys change
+    self.__semaphore_cfg_cache = None
+
     super(_SemaphoredPairedPluginMixin, self).__init__()
     return
 
@@ -66,27 +97,60 @@ class _SemaphoredPairedPluginMixin(object):
     """Build a prefixed env key from semaphore key and env key."""
     return "{}_{}".format(semaphore_key, env_key)
 
+  def _semaphore_get_config(self):
+    """
+    Get the resolved semaphore configuration of this plugin.
+
+    Both provider and consumer methods run on every process loop iteration, so
+    `cfg_semaphore` / `cfg_semaphored_keys` are resolved once and cached. The
+    cache is keyed on the identity of `config_data` and of the raw SEMAPHORE /
+    SEMAPHORED_KEYS values: `config_data` may be replaced, but it is also updated
+    in place (`update_config_data`, direct item assignment), which stores new
+    value objects under the changed keys.
+
+    Returns
+    -------
+    tuple
+      (semaphore_key, semaphored_keys) where `semaphore_key` is the provider
+      SEMAPHORE (or None) and `semaphored_keys` is a tuple of consumer keys.
+    """
+    config_data = getattr(self, 'config_data', None)
+    raw_values = (None, None)
+    if isinstance(config_data, dict):
+      raw_values = (config_data.get('SEMAPHORE'), config_data.get('SEMAPHORED_KEYS'))
+    cache = self.__semaphore_cfg_cache
+    if (
+      cache is None or cache[0] is not config_data
+      or cache[1][0] is not raw_values[0] or cache[1][1] is not raw_values[1]
+    ):
+      semaphore_key = getattr(self, 'cfg_semaphore', None)
+      semaphored_keys = tuple(getattr(self, 'cfg_semaphored_keys', None) or ())
+      cache = (config_data, raw_values, semaphore_key, semaphored_keys)
+      self.__semaphore_cfg_cache = cache
+    return cache[2], cache[3]
+
+  def _semaphore_get_key(self):
+    """Get the SEMAPHORE key this plugin provides (None if not a provider)."""
+    return self._semaphore_get_config()[0]
+
   # ============================================================================
   # Provider Methods (for native plugins that signal readiness)
   # ============================================================================
 
   def _semaphore_ensure_structure(self):
     """Ensure the semaphore data structure exists in shared memory."""
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return None
 
-    if semaphore_key not in self.plugins_shmem:
-      self.plugins_shmem[semaphore_key] = {
-        'is_ready': False,
-        'env': {},
-        'metadata': {
-          'instance_id': self.cfg_instance_id,
-          'plugin_signature': self.__class__.__name__,
-          'ready_timestamp': None,
-        }
-      }
-    return self.plugins_shmem[semaphore_key]
+    state = self.plugins_shmem.get(semaphore_key)
+    if state is None:
+      state = _new_semaphore_state(
+        instance_id=self.cfg_instance_id,
+        plugin_signature=self.__class__.__name__,
+      )
+      self.plugins_shmem[semaphore_key] = state
+    return state
 
   def semaphore_set_ready(self):
     """
@@ -98,13 +162,13 @@ class _SemaphoredPairedPluginMixin(object):
     bool
       True if semaphore was set, False if SEMAPHORE not configured
     """
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return False
 
-    semaphore_data = self._semaphore_ensure_structure()
-    semaphore_data['is_ready'] = True
-    semaphore_data['metadata']['ready_timestamp'] = tm()
+    state = self._semaphore_ensure_structure()
+    state['is_ready'] = True
+    state['metadata']['ready_timestamp'] = tm()
     self._semaphore_Pd("Semaphore '{}' set to READY".format(semaphore_key))
     return True
 
@@ -127,17 +191,17 @@ class _SemaphoredPairedPluginMixin(object):
     bool
       True if env var was set, False if SEMAPHORE not configured
     """
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return False
 
-    semaphore_data = self._semaphore_ensure_structure()
+    env = self._semaphore_ensure_structure()['env']
 
     # Store both prefixed and raw variants for flexibility
     value_str = str(value)
     prefixed_key = self._semaphore_prefixed_key(semaphore_key, key)
-    semaphore_data['env'][prefixed_key] = value_str
-    semaphore_data['env'][key] = value_str
+    env[prefixed_key] = value_str
+    env[key] = value_str
     self._semaphore_Pd(
       "Semaphore '{}' env vars set: {} / {} = {}".format(
         semaphore_key, prefixed_key, key, value))
@@ -160,12 +224,19 @@ class _SemaphoredPairedPluginMixin(object):
     bool
       True if all env vars were set, False if SEMAPHORE not configured
     """
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return False
 
+    # Resolve the state and prefix once, then write all pairs in a single pass
+    env = self._semaphore_ensure_structure()['env']
+    prefix = self._semaphore_prefixed_key(semaphore_key, '')
     for key, value in env_dict.items():
-      self.semaphore_set_env(key, value)
+      value_str = str(value)
+      env[prefix + key] = value_str
+      env[key] = value_str
+    self._semaphore_Pd("Semaphore '{}' env vars set: {}".format(
+      semaphore_key, list(env_dict.keys())))
     return True
 
   def semaphore_clear(self):
@@ -175,13 +246,14 @@ class _SemaphoredPairedPluginMixin(object):
     This signals to waiting plugins that this dependency is no longer available.
     Should be called in on_close() of provider plugins.
     """
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return
 
-    if semaphore_key in self.plugins_shmem:
-      self.plugins_shmem[semaphore_key]['is_ready'] = False
-      self.plugins_shmem[semaphore_key]['metadata']['ready_timestamp'] = None
+    state = self.plugins_shmem.get(semaphore_key)
+    if state is not None:
+      state['is_ready'] = False
+      state['metadata']['ready_timestamp'] = None
       self._semaphore_Pd("Semaphore '{}' cleared".format(semaphore_key))
     return
 
@@ -209,7 +281,7 @@ class _SemaphoredPairedPluginMixin(object):
     None
     """
     # Early exit if semaphore not configured
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return
 
@@ -302,7 +374,7 @@ class _SemaphoredPairedPluginMixin(object):
     -------
     None
     """
-    semaphore_key = getattr(self, 'cfg_semaphore', None)
+    semaphore_key = self._semaphore_get_key()
     if not semaphore_key:
       return
 
@@ -389,9 +461,51 @@ class _SemaphoredPairedPluginMixin(object):
   # ============================================================================
 
   def _semaphore_get_keys(self):
-    """Get the list of semaphore keys this plugin waits for."""
-    keys = getattr(self, 'cfg_semaphored_keys', None)
-    return keys if keys else []
+    """Get the tuple of semaphore keys this plugin waits for."""
+    return self._semaphore_get_config()[1]
+
+  def _semaphore_snapshot(self):
+    """
+    Walk the required semaphores once and collect readiness and env data.
+
+    Each shared-memory entry is looked up a single time (no default dict is
+    allocated for missing entries), so consumers that need readiness, missing
+    keys and env in the same tick do not re-walk `plugins_shmem`.
+
+    Returns
+    -------
+    tuple
+      (ready, missing, env) where `ready` and `missing` are lists of semaphore
+      keys and `env` is the merged env dict of all ready semaphores.
+    """
+    ready, missing, env = [], [], {}
+    plugins_shmem = self.plugins_shmem
+    for key in self._semaphore_get_keys():
+      state = plugins_shmem.get(key)
+      if state is not None and state.get('is_ready', False):
+        ready.append(key)
+        state_env = state.get('env')
+        if state_env:
+          env.update(state_env)
+      else:
+        missing.append(key)
+    return ready, missing, env
+
+  def semaphore_all_ready_fast(self):
+    """
+    Check if all required semaphores are ready, stopping at the first one that is not.
+
+    Returns
+    -------
+    bool
+      True if all SEMAPHORED_KEYS are ready (or none are configured), False otherwise
+    """
+    plugins_shmem = self.plugins_shmem
+    for key in self._semaphore_get_keys():
+      state = plugins_shmem.get(key)
+      if state is None or not state.get('is_ready', False):
+        return False
+    return True
 
   def semaphore_is_ready(self, semaphore_key=None):
     """
@@ -409,20 +523,11 @@ class _SemaphoredPairedPluginMixin(object):
     """
     if semaphore_key:
       # Check specific semaphore
-      shmem_data = self.plugins_shmem.get(semaphore_key, {})
-      return shmem_data.get('is_ready', False)
+      state = self.plugins_shmem.get(semaphore_key)
+      return state is not None and state.get('is_ready', False)
 
-    # Check all required semaphores
-    required_keys = self._semaphore_get_keys()
-    if not required_keys:
-      return True  # No dependencies, always ready
-
-    for key in required_keys:
-      shmem_data = self.plugins_shmem.get(key, {})
-      if not shmem_data.get('is_ready', False):
-        return False
-
-    return True
+    # Check all required semaphores (no dependencies means always ready)
+    return self.semaphore_all_ready_fast()
 
   def semaphore_get_env(self):
     """
@@ -433,23 +538,13 @@ class _SemaphoredPairedPluginMixin(object):
     dict
       Merged dictionary of all environment variables from ready semaphores
     """
-    required_keys = self._semaphore_get_keys()
-    if not required_keys:
-      return {}
-
-    result = {}
-    for key in required_keys:
-      shmem_data = self.plugins_shmem.get(key, {})
-      if shmem_data.get('is_ready', False):
-        env_vars = shmem_data.get('env', {})
-        if env_vars:
-          self._semaphore_Pd("Semaphore '{}' provides {} env vars: {}".format(
-            key, len(env_vars), list(env_vars.keys())))
-        result.update(env_vars)
-      else:
-        self._semaphore_Pd("Semaphore '{}' not ready, skipping env retrieval".format(key))
-
-    return result
+    ready, missing, env = self._semaphore_snapshot()
+    if ready:
+      self._semaphore_Pd("Semaphores {} provide {} env vars: {}".format(
+        ready, len(env), list(env.keys())))
+    if missing:
+      self._semaphore_Pd("Semaphores {} not ready, skipping env retrieval".format(missing))
+    return env
 
 
   def semaphore_get_env_value(self, semaphore_key, env_key, default=""):
@@ -470,8 +565,10 @@ class _SemaphoredPairedPluginMixin(object):
     str
         The value of the environment variable, or default if not found
     """
-    shmem_data = self.plugins_shmem.get(semaphore_key, {})
-    value = shmem_data.get('env', {}).get(env_key, default)
+    state = self.plugins_shmem.get(semaphore_key)
+    if state is None:
+      return default
+    value = (state.get('env') or {}).get(env_key, default)
     return str(value) if value is not None else default
 
 
@@ -496,11 +593,10 @@ class _SemaphoredPairedPluginMixin(object):
         The env value, or default if not found
     """
     for semaphore_key in self._semaphore_get_keys():
-      shmem_data = self.plugins_shmem.get(semaphore_key, {})
-      if not shmem_data.get('is_ready', False):
+      state = self.plugins_shmem.get(semaphore_key)
+      if state is None or not state.get('is_ready', False):
         continue
-      env_vars = shmem_data.get('env', {})
-      for env_key, env_value in env_vars.items():
+      for env_key, env_value in (state.get('env') or {}).items():
         constructed_key = self._semaphore_prefixed_key(semaphore_key, env_key)
         if constructed_key == full_key:
           return str(env_value)
@@ -516,11 +612,7 @@ class _SemaphoredPairedPluginMixin(object):
     list
       List of semaphore keys that are not ready
     """
-    missing = []
-    for key in self._semaphore_get_keys():
-      if not self.semaphore_is_ready(key):
-        missing.append(key)
-    return missing
+    return self._semaphore_snapshot()[1]
 
   def semaphore_get_status(self):
     """
@@ -533,12 +625,12 @@ class _SemaphoredPairedPluginMixin(object):
     """
     status = {}
     for key in self._semaphore_get_keys():
-      shmem_data = self.plugins_shmem.get(key, {})
-      if shmem_data:
-        metadata = shmem_data.get('metadata', {})
+      state = self.plugins_shmem.get(key)
+      if state is not None:
+        metadata = state.get('metadata') or {}
         status[key] = {
-          'ready': shmem_data.get('is_ready', False),
-          'env_count': len(shmem_data.get('env', {})),
+          'ready': state.get('is_ready', False),
+          'env_count': len(state.get('env') or {}),
           'provider': metadata.get('plugin_signature'),
           'ready_since': metadata.get('ready_timestamp'),
         }
@@ -560,7 +652,7 @@ class _SemaphoredPairedPluginMixin(object):
     if self.__semaphore_wait_start is None:
       self.__semaphore_wait_start = tm()
       required_keys = self._semaphore_get_keys()
-      self._semaphore_Pd("Starting wait for semaphores: {}".format(required_keys))
+      self._semaphore_Pd("Starting wait for semaphores: {}".format(list(required_keys)))
     return
 
   def semaphore_get_wait_elapsed(self):
@@ -593,22 +685,13 @@ class _SemaphoredPairedPluginMixin(object):
     bool
       True if all semaphores are ready, False otherwise
     """
-    required_keys = self._semaphore_get_keys()
-    if not required_keys:
-      return True
-
-    all_ready = True
-    for key in required_keys:
-      is_ready = self.semaphore_is_ready(key)
-      if is_ready and key not in self.__semaphore_ready_logged:
-        shmem_data = self.plugins_shmem.get(key, {})
-        metadata = shmem_data.get('metadata', {})
-        provider = metadata.get('plugin_signature', 'unknown')
-        env_count = len(shmem_data.get('env', {}))
+    ready, missing, _ = self._semaphore_snapshot()
+    for key in ready:
+      if key not in self.__semaphore_ready_logged:
+        state = self.plugins_shmem.get(key) or {}
+        provider = (state.get('metadata') or {}).get('plugin_signature') or 'unknown'
         self._semaphore_Pd("Semaphore '{}' READY (provider: {}, env_vars: {})".format(
-          key, provider, env_count))
+          key, provider, len(state.get('env') or {})))
         self.__semaphore_ready_logged.add(key)
-      elif not is_ready:
-        all_ready = False
 
-    return all_ready
+    return not missing
@@ -2,6 +2,7 @@ import importlib.util
 import json
 from pathlib import Path
 import sys
+import threading
 import types
 import unittest
 
@@ -21,6 +22,7 @@ def _load_deeploy_chainstore_response_mixin_module():
   )
   constants = types.SimpleNamespace(
     BASE_CT=base_ct,
+    THREADS_PREFIX="S_",
     CURRENT_EVM_NET_CONSTANTS={
       evm_net_constants.SEED_NODES_ADDRESSES_KEY: ["seed-1", "seed-2"],
     },
@@ -98,6 +100,9 @@ class _DeeployChainstoreResponseHarness(_DeeployChainstoreResponseMixin, _DummyB
       return self.selected_seed
     return seed_peers[0] if len(seed_peers) > 0 else None
 
+  def check_debug_logging_enabled(self):
+    return False
+
   def json_dumps(self, value):
     return json.dumps(value)
 
@@ -180,6 +185,7 @@ class DeeployChainstoreResponseMixinTests(unittest.TestCase):
     harness = _DeeployChainstoreResponseHarness()
 
     self.assertTrue(harness._send_chainstore_response())
+    self.assertTrue(harness._chainstore_response_flush())
 
     args, kwargs = harness.calls[-1]
     self.assertEqual(args[0], "response-key")
@@ -193,6 +199,7 @@ class DeeployChainstoreResponseMixinTests(unittest.TestCase):
     harness = _DeeployChainstoreResponseHarness()
 
     self.assertTrue(harness._reset_chainstore_response())
+    self.assertTrue(harness._chainstore_response_flush())
 
     args, kwargs = harness.calls[-1]
     self.assertEqual(args, ("response-key", None))
@@ -229,6 +236,124 @@ class DeeployChainstoreResponseMixinTests(unittest.TestCase):
     self.assertEqual(kwargs["include_configured_peers"], False)
     self.assertEqual(kwargs["debug"], True)
 
+  def test_send_chainstore_response_serializes_payload_only_in_debug(self):
+    harness = _DeeployChainstoreResponseHarness()
+    dumps = []
+    harness.json_dumps = lambda value: dumps.append(value) or json.dumps(value)
+
+    self.assertTrue(harness._send_chainstore_response())
+    self.assertEqual(dumps, [])
+
+    harness.check_debug_logging_enabled = lambda: True
+    self.assertTrue(harness._send_chainstore_response())
+    self.assertEqual(len(dumps), 1)
+    self.assertTrue(harness._chainstore_response_flush())
+    harness._chainstore_response_shutdown()
+
+  def test_invalid_response_key_is_reported_once_per_config(self):
+    harness = _DeeployChainstoreResponseHarness()
+    harness.config_data = {}
+    harness.cfg_chainstore_response_key = ""
+
+    for _ in range(3):
+      self.assertFalse(harness._should_send_chainstore_response())
+    invalid_logs = [log for log in harness.logs if "is configured but invalid" in log[0]]
+    self.assertEqual(len(invalid_logs), 1)
+
+    harness.config_data = {}
+    harness.cfg_chainstore_response_key = "new-key"
+    self.assertTrue(harness._should_send_chainstore_response())
+    self.assertEqual(harness._get_chainstore_response_key(), "new-key")
+
+  def test_response_key_updated_in_place_is_picked_up(self):
+    class _ConfigBackedHarness(_DeeployChainstoreResponseHarness):
+      @property
+      def cfg_chainstore_response_key(self):
+        return self.config_data.get("CHAINSTORE_RESPONSE_KEY")
+
+      @cfg_chainstore_response_key.setter
+      def cfg_chainstore_response_key(self, value):
+        return
+
+    harness = _ConfigBackedHarness()
+    harness.config_data = {"CHAINSTORE_RESPONSE_KEY": "old-key"}
+    self.assertEqual(harness._get_chainstore_response_key(), "old-key")
+
+    # `update_config_data` / direct assignment mutate `config_data` in place
+    harness.config_data["CHAINSTORE_RESPONSE_KEY"] = "new-key"
+
+    self.assertEqual(harness._get_chainstore_response_key(), "new-key")
+
+  def test_reset_and_send_are_written_in_submission_order(self):
+    harness = _DeeployChainstoreResponseHarness()
+
+    self.assertTrue(harness._reset_chainstore_response())
+    self.assertTrue(harness._send_chainstore_response())
+    self.assertTrue(harness._chainstore_response_flush())
+
+    self.assertEqual([call[0][1] is None for call in harness.calls], [True, False])
+    harness._chainstore_response_shutdown()
+
+  def test_failed_background_send_is_retried_by_auto_send(self):
+    harness = _DeeployChainstoreResponseHarness()
+    harness.is_plugin_ready = lambda: True
+    results = [False, True]
+    write_calls = []
+
+    def chainstore_set(*args, **kwargs):
+      write_calls.append(args)
+      return results.pop(0)
+
+    harness.chainstore_set = chainstore_set
+
+    harness._chainstore_maybe_auto_send()
+    self.assertTrue(harness._chainstore_response_flush())
+    self.assertFalse(harness._chainstore_response_sent)
+
+    harness._chainstore_maybe_auto_send()
+    self.assertTrue(harness._chainstore_response_flush())
+    self.assertTrue(harness._chainstore_response_sent)
+    self.assertEqual(len(write_calls), 2)
+    harness._chainstore_response_shutdown()
+
+  def test_write_after_shutdown_runs_synchronously(self):
+    harness = _DeeployChainstoreResponseHarness()
+    self.assertTrue(harness._reset_chainstore_response())
+    harness._chainstore_response_shutdown()
+    self.assertEqual(len(harness.calls), 1)
+
+    self.assertTrue(harness._send_chainstore_response())
+
+    # no flush needed: the write already happened in the caller thread
+    self.assertEqual(len(harness.calls), 2)
+    self.assertIsNotNone(harness.calls[1][0][1])
+    self.assertEqual(len(harness._chainstore_pending), 0)
+
+  def test_shutdown_does_not_wait_forever_on_a_blocked_write(self):
+    harness = _DeeployChainstoreResponseHarness()
+    started = threading.Event()
+    release = threading.Event()
+    writer_threads = []
+
+    def chainstore_set(*args, **kwargs):
+      writer_threads.append(threading.current_thread())
+      started.set()
+      release.wait(5)
+      return True
+
+    harness.chainstore_set = chainstore_set
+    self.assertTrue(harness._send_chainstore_response())
+    self.assertTrue(started.wait(5))
+
+    harness._chainstore_response_shutdown(timeout=0.05)
+
+    self.assertEqual(len(harness._chainstore_pending), 1)
+    self.assertTrue(writer_threads[0].daemon)
+    self.assertTrue(writer_threads[0].name.startswith("S_chainstore_resp"))
+    release.set()
+    writer_threads[0].join(5)
+    self.assertFalse(writer_threads[0].is_alive())
+
 
 if __name__ == "__main__":
   unittest.main()
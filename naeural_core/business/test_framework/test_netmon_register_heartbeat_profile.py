@@ -14,7 +14,8 @@ from unittest import mock
 
 from naeural_core import constants as ct
 from naeural_core.core_logging import Logger
-from naeural_core.main.net_mon import NetworkMonitor
+from naeural_core.main import net_mon as net_mon_module
+from naeural_core.main.net_mon import NetworkMonitor, NETMON_MUTEX, _parse_hb_timestamp
 
 
 PROFILE_NODES_ENV = "EE_NETMON_PROFILE_NODES"
@@ -566,6 +567,39 @@ class TestNetmonRegisterHeartbeatProfile(unittest.TestCase):
     patched_deepcopy.assert_called()
     self.assertEqual(latest[ct.HB.GPUS][0]["NAME"], "RTX_TEST")
 
+  def test_heartbeat_storage_snapshot_happens_outside_netmon_lock(self):
+    harness = _NetmonHarness()
+    addr = "0xNODE_STORE_COPY_LOCK"
+    plain = harness.make_heartbeat_body(addr, 0, 0, payload_scale=4)
+
+    lock_depth = 0
+    original_managed_lock = harness.log.managed_lock_resource
+
+    @contextlib.contextmanager
+    def tracked_managed_lock(name):
+      nonlocal lock_depth
+      with original_managed_lock(name):
+        lock_depth += 1
+        try:
+          yield
+        finally:
+          lock_depth -= 1
+
+    def deepcopy_must_run_before_lock(obj):
+      self.assertEqual(lock_depth, 0)
+      return copy.deepcopy(obj)
+
+    harness.log.managed_lock_resource = tracked_managed_lock
+    with mock.patch(
+      "naeural_core.main.net_mon.deepcopy",
+      side_effect=deepcopy_must_run_before_lock,
+    ) as patched_deepcopy:
+      harness.netmon.register_heartbeat(addr, plain)
+
+    patched_deepcopy.assert_called()
+    stored = harness.netmon.get_box_heartbeats(addr, return_copy=False)[-1]
+    self.assertIn(ct.HB.RECEIVED_TIME, stored)
+
   def test_public_derived_readers_return_detached_mutable_values(self):
     harness = _NetmonHarness()
     addr = "0xNODE_DERIVED_READS"
@@ -644,6 +678,153 @@ class TestNetmonRegisterHeartbeatProfile(unittest.TestCase):
     self.assertEqual(hb, original)
     self.assertIn(ct.HB.ENCODED_DATA, hb)
 
+  def test_register_heartbeats_batch_takes_netmon_lock_once(self):
+    batch_harness = _NetmonHarness()
+    single_harness = _NetmonHarness()
+    addrs = ["0xNODE_BATCH_A", "0xNODE_BATCH_B"]
+    items = [
+      (addr, batch_harness.make_heartbeat(addr, node_idx, hb_idx, payload_scale=2))
+      for hb_idx in range(3)
+      for node_idx, addr in enumerate(addrs)
+    ]
+    # a redelivered heartbeat is dropped exactly like in the single path
+    items.append(items[-1])
+
+    lock_calls = 0
+    original_managed_lock = batch_harness.log.managed_lock_resource
+
+    @contextlib.contextmanager
+    def counting_managed_lock(name):
+      nonlocal lock_calls
+      lock_calls += int(name == NETMON_MUTEX)
+      with original_managed_lock(name):
+        yield
+
+    batch_harness.log.managed_lock_resource = counting_managed_lock
+    accepted = batch_harness.netmon.register_heartbeats(items)
+    batch_harness.log.managed_lock_resource = original_managed_lock
+    for addr, hb in items:
+      single_harness.netmon.register_heartbeat(addr, hb)
+
+    self.assertEqual(lock_calls, 1)
+    self.assertEqual(accepted, 6)
+    self.assertEqual(batch_harness.epoch_manager.calls, 6)
+    for addr in addrs:
+      batch_history = [
+        {k: v for k, v in hb.items() if k != ct.HB.RECEIVED_TIME}
+        for hb in batch_harness.netmon.get_box_heartbeats(addr)
+      ]
+      single_history = [
+        {k: v for k, v in hb.items() if k != ct.HB.RECEIVED_TIME}
+        for hb in single_harness.netmon.get_box_heartbeats(addr)
+      ]
+      self.assertEqual(batch_history, single_history)
+
+  def test_register_heartbeats_skips_malformed_item_without_dropping_batch(self):
+    harness = _NetmonHarness()
+    addr = "0xNODE_BATCH_MALFORMED"
+    malformed = harness.make_heartbeat(addr, 0, 1, payload_scale=2)
+    malformed[ct.HB.ENCODED_DATA] = "not-a-compressed-heartbeat"
+    items = [
+      (addr, harness.make_heartbeat(addr, 0, 0, payload_scale=2)),
+      (addr, malformed),
+      (addr, harness.make_heartbeat(addr, 0, 2, payload_scale=2)),
+    ]
+
+    accepted = harness.netmon.register_heartbeats(items)
+
+    self.assertEqual(accepted, 2)
+    self.assertEqual(harness.epoch_manager.calls, 2)
+    self.assertEqual(len(harness.netmon.get_box_heartbeats(addr)), 2)
+
+  def test_redelivered_latest_heartbeat_is_dropped_before_decoding(self):
+    harness = _NetmonHarness()
+    addr = "0xNODE_REDELIVERED"
+    heartbeats = [harness.make_heartbeat(addr, 0, hb_idx, payload_scale=2) for hb_idx in range(2)]
+    for hb in heartbeats:
+      harness.netmon.register_heartbeat(addr, hb)
+
+    with mock.patch.object(
+      harness.netmon,
+      "_NetworkMonitor__decode_heartbeat_data",
+      wraps=harness.netmon._NetworkMonitor__decode_heartbeat_data,
+    ) as decode_mock:
+      harness.netmon.register_heartbeat(addr, heartbeats[-1])
+      self.assertEqual(harness.netmon.register_heartbeats([(addr, heartbeats[-1])]), 0)
+      self.assertEqual(decode_mock.call_count, 0)
+
+      # older redeliveries miss the pre-check but are still dropped under the lock
+      harness.netmon.register_heartbeat(addr, heartbeats[0])
+      self.assertEqual(decode_mock.call_count, 1)
+
+    self.assertEqual(len(harness.netmon.get_box_heartbeats(addr)), 2)
+    self.assertEqual(harness.epoch_manager.calls, 2)
+
+  def test_address_prefix_removal_is_memoized_per_address(self):
+    harness = _NetmonHarness()
+    addr = "0xai_NODE_PREFIX_CACHE"
+    block_engine = harness.netmon._NetworkMonitor__blockchain_manager
+
+    with mock.patch.object(
+      block_engine,
+      "maybe_remove_prefix",
+      wraps=block_engine.maybe_remove_prefix,
+    ) as remove_prefix_mock:
+      for hb_idx in range(3):
+        harness.netmon.register_heartbeat(
+          addr,
+          harness.make_heartbeat(addr, 0, hb_idx, payload_scale=2),
+        )
+
+    self.assertEqual(remove_prefix_mock.call_count, 1)
+    self.assertEqual(len(harness.netmon.get_box_heartbeats("NODE_PREFIX_CACHE")), 3)
+
+  def test_heartbeat_timestamp_fast_parse_matches_strptime(self):
+    canonical = datetime(2026, 10, 15, 9, 5, 7, 123456).strftime(ct.HB.TIMESTAMP_FORMAT)
+    cases = [
+      (canonical, 1),                       # repo heartbeat format
+      ("2026-10-15 23:59:59.000001", 1),    # fractional seconds
+      ("2026-10-15 09:05:07.5", 0),         # short fraction: strptime fallback
+    ]
+
+    for str_ts, fast_calls in cases:
+      with self.subTest(str_ts=str_ts):
+        with mock.patch.object(net_mon_module, "dt", mock.Mock(wraps=datetime)) as dt_mock:
+          parsed = _parse_hb_timestamp(str_ts)
+        self.assertEqual(dt_mock.fromisoformat.call_count, fast_calls)
+        self.assertEqual(dt_mock.strptime.call_count, 1 - fast_calls)
+        self.assertEqual(parsed, datetime.strptime(str_ts, ct.HB.TIMESTAMP_FORMAT))
+
+    # 26-char values strptime rejects must fail the same way; ISO extras such as
+    # `Z` / UTC offsets would otherwise become aware datetimes via fromisoformat
+    for invalid in (
+      "2026-13-15 09:05:07.123456",
+      "2026-10-15 09:05:07.12345Z",
+      "2026-10-15 09:05:07.1+0000",
+    ):
+      with self.subTest(invalid=invalid):
+        with self.assertRaises(ValueError):
+          datetime.strptime(invalid, ct.HB.TIMESTAMP_FORMAT)
+        with mock.patch.object(net_mon_module, "dt", mock.Mock(wraps=datetime)) as dt_mock:
+          with self.assertRaises(ValueError):
+            _parse_hb_timestamp(invalid)
+        if not invalid[20:].isdigit():
+          self.assertEqual(dt_mock.fromisoformat.call_count, 0)
+
+  def test_uncompressed_heartbeat_storage_detaches_only_nested_values(self):
+    harness = _NetmonHarness()
+    addr = "0xNODE_PLAIN_SNAPSHOT"
+    plain = harness.make_heartbeat_body(addr, 0, 0, payload_scale=4)
+
+    harness.netmon.register_heartbeat(addr, plain)
+    stored = harness.netmon.get_box_heartbeats(addr, return_copy=False)[-1]
+
+    self.assertIs(stored[ct.HB.EE_ADDR], plain[ct.HB.EE_ADDR])
+    self.assertEqual(stored[ct.HB.GPUS], plain[ct.HB.GPUS])
+    self.assertIsNot(stored[ct.HB.GPUS], plain[ct.HB.GPUS])
+    plain[ct.HB.GPUS][0]["NAME"] = "MUTATED_BY_CALLER"
+    self.assertEqual(stored[ct.HB.GPUS][0]["NAME"], "RTX_TEST")
+
   def test_compressed_and_uncompressed_heartbeats_store_equivalent_latest_data(self):
     compressed_harness = _NetmonHarness()
     plain_harness = _NetmonHarness()
@@ -0,0 +1,230 @@
+import importlib.util
+import json
+from pathlib import Path
+import unittest
+
+
+def _load_semaphored_paired_plugin_mixin_module():
+  """
+  Load the mixin module without importing the full `naeural_core` package.
+
+  The package import path pulls optional runtime dependencies such as torch,
+  which are not needed for these focused mixin tests.
+  """
+  module_path = (
+    Path(__file__).resolve().parents[1]
+    / "mixins_base"
+    / "semaphored_paired_plugin_mixin.py"
+  )
+  spec = importlib.util.spec_from_file_location(
+    "semaphored_paired_plugin_mixin_under_test",
+    module_path,
+  )
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+_SEMAPHORED_PAIRED_PLUGIN_MIXIN_MODULE = _load_semaphored_paired_plugin_mixin_module()
+_SemaphoredPairedPluginMixin = _SEMAPHORED_PAIRED_PLUGIN_MIXIN_MODULE._SemaphoredPairedPluginMixin
+_new_semaphore_state = _SEMAPHORED_PAIRED_PLUGIN_MIXIN_MODULE._new_semaphore_state
+
+
+def _make_state(is_ready, env=None):
+  state = _new_semaphore_state(instance_id="provider", plugin_signature="PROVIDER")
+  state["is_ready"] = is_ready
+  state["env"].update(env or {})
+  return state
+
+
+class _Harness(_SemaphoredPairedPluginMixin):
+  def __init__(self, config_data, plugins_shmem=None):
+    self.config_data = config_data
+    self.plugins_shmem = plugins_shmem if plugins_shmem is not None else {}
+    self.cfg_reads = 0
+    self.cfg_instance_id = "inst"
+    self.get_instance_config = lambda: {}
+    self._instance_id = "inst"
+    self._signature = "SIG"
+    super(_Harness, self).__init__()
+
+  @property
+  def cfg_semaphore(self):
+    self.cfg_reads += 1
+    return self.config_data.get("SEMAPHORE")
+
+  @property
+  def cfg_semaphored_keys(self):
+    self.cfg_reads += 1
+    return self.config_data.get("SEMAPHORED_KEYS")
+
+  def P(self, *args, **kwargs):
+    return
+
+  def time(self):
+    return 0
+
+
+class SemaphoredPairedPluginMixinConfigCacheTests(unittest.TestCase):
+
+  def test_config_resolved_once_per_config_data(self):
+    harness = _Harness({"SEMAPHORE": "SEM_A", "SEMAPHORED_KEYS": ["SEM_B"]})
+
+    for _ in range(5):
+      self.assertEqual(harness._semaphore_get_key(), "SEM_A")
+      self.assertEqual(harness._semaphore_get_keys(), ("SEM_B",))
+
+    self.assertEqual(harness.cfg_reads, 2)
+
+  def test_config_refreshed_after_reconfig(self):
+    harness = _Harness({"SEMAPHORE": "SEM_A", "SEMAPHORED_KEYS": ["SEM_B"]})
+    self.assertEqual(harness._semaphore_get_key(), "SEM_A")
+
+    harness.config_data = {"SEMAPHORE": None, "SEMAPHORED_KEYS": ["SEM_C", "SEM_D"]}
+
+    self.assertIsNone(harness._semaphore_get_key())
+    self.assertEqual(harness._semaphore_get_keys(), ("SEM_C", "SEM_D"))
+
+  def test_config_refreshed_after_in_place_update(self):
+    harness = _Harness({"SEMAPHORE": "SEM_A", "SEMAPHORED_KEYS": ["SEM_B"]})
+    self.assertEqual(harness._semaphore_get_key(), "SEM_A")
+    self.assertEqual(harness._semaphore_get_keys(), ("SEM_B",))
+
+    # `update_config_data` / direct assignment mutate `config_data` in place
+    harness.config_data["SEMAPHORE"] = "SEM_X"
+    harness.config_data["SEMAPHORED_KEYS"] = ["SEM_Y"]
+
+    self.assertEqual(harness._semaphore_get_key(), "SEM_X")
+    self.assertEqual(harness._semaphore_get_keys(), ("SEM_Y",))
+
+  def test_missing_keys_use_cached_config(self):
+    shmem = {"SEM_B": _make_state(True)}
+    harness = _Harness({"SEMAPHORED_KEYS": ["SEM_B", "SEM_C"]}, plugins_shmem=shmem)
+
+    self.assertEqual(harness.semaphore_get_missing(), ["SEM_C"])
+    self.assertFalse(harness.semaphore_is_ready())
+    self.assertEqual(harness.cfg_reads, 2)
+
+
+class SemaphoredPairedPluginMixinSnapshotTests(unittest.TestCase):
+
+  def _make_harness(self):
+    shmem = {
+      "SEM_A": _make_state(True, {"A_HOST": "a"}),
+      "SEM_B": _make_state(False, {"B_HOST": "b"}),
+    }
+    return _Harness({"SEMAPHORED_KEYS": ["SEM_A", "SEM_B", "SEM_C"]}, plugins_shmem=shmem)
+
+  def test_snapshot_collects_ready_missing_and_env_in_one_pass(self):
+    harness = self._make_harness()
+
+    ready, missing, env = harness._semaphore_snapshot()
+
+    self.assertEqual(ready, ["SEM_A"])
+    self.assertEqual(missing, ["SEM_B", "SEM_C"])
+    self.assertEqual(env, {"A_HOST": "a"})
+    self.assertNotIn("SEM_C", harness.plugins_shmem)
+
+  def test_wrappers_agree_with_snapshot(self):
+    harness = self._make_harness()
+
+    self.assertFalse(harness.semaphore_all_ready_fast())
+    self.assertFalse(harness.semaphore_check_with_logging())
+    self.assertEqual(harness.semaphore_get_env(), {"A_HOST": "a"})
+    self.assertEqual(harness.semaphore_get_missing(), ["SEM_B", "SEM_C"])
+
+    harness.plugins_shmem["SEM_B"]["is_ready"] = True
+    harness.plugins_shmem["SEM_C"] = _make_state(True)
+
+    self.assertTrue(harness.semaphore_all_ready_fast())
+    self.assertTrue(harness.semaphore_is_ready())
+    self.assertTrue(harness.semaphore_check_with_logging())
+    self.assertEqual(harness.semaphore_get_env(), {"A_HOST": "a", "B_HOST": "b"})
+
+
+class SemaphoredPairedPluginMixinStateTests(unittest.TestCase):
+
+  def test_provider_state_is_visible_to_consumer(self):
+    shmem = {}
+    provider = _Harness({"SEMAPHORE": "SEM_P"}, plugins_shmem=shmem)
+    consumer = _Harness({"SEMAPHORED_KEYS": ["SEM_P"]}, plugins_shmem=shmem)
+
+    self.assertTrue(provider.semaphore_set_env("PORT", 8080))
+    self.assertFalse(consumer.semaphore_is_ready())
+    self.assertTrue(provider.semaphore_set_ready())
+
+    self.assertIs(type(shmem["SEM_P"]), dict)
+    self.assertTrue(consumer.semaphore_is_ready())
+    self.assertEqual(consumer.semaphore_get_env(), {"SEM_P_PORT": "8080", "PORT": "8080"})
+    self.assertEqual(consumer.semaphore_get_env_value("SEM_P", "PORT"), "8080")
+    self.assertEqual(consumer.semaphore_get_env_value_by_path("SEM_P_PORT"), "8080")
+    status = consumer.semaphore_get_status()["SEM_P"]
+    self.assertEqual(status["ready"], True)
+    self.assertEqual(status["env_count"], 2)
+    self.assertEqual(status["provider"], "_Harness")
+
+    provider.semaphore_clear()
+    self.assertFalse(consumer.semaphore_is_ready())
+    self.assertIsNone(shmem["SEM_P"]["metadata"]["ready_timestamp"])
+
+  def test_set_env_dict_matches_per_key_set_env(self):
+    single = _Harness({"SEMAPHORE": "SEM_P"})
+    batch = _Harness({"SEMAPHORE": "SEM_P"})
+    env_dict = {"HOST": "127.0.0.1", "PORT": 8080}
+
+    for key, value in env_dict.items():
+      single.semaphore_set_env(key, value)
+    self.assertTrue(batch.semaphore_set_env_dict(env_dict))
+
+    self.assertEqual(batch.plugins_shmem["SEM_P"]["env"], single.plugins_shmem["SEM_P"]["env"])
+    self.assertFalse(_Harness({}).semaphore_set_env_dict(env_dict))
+
+  def test_state_keeps_dict_style_read_access(self):
+    state = _make_state(True, {"K": "v"})
+
+    self.assertTrue(state.get("is_ready"))
+    self.assertEqual(state.get("env"), {"K": "v"})
+    self.assertEqual(state.get("metadata")["plugin_signature"], "PROVIDER")
+    self.assertEqual(state.get("unknown", {}), {})
+
+  def test_external_consumer_reads_shmem_entry_as_plain_dict(self):
+    shmem = {}
+    provider = _Harness({"SEMAPHORE": "SEM_P"}, plugins_shmem=shmem)
+    provider.semaphore_set_env("HOST", "10.0.0.1")
+    provider.semaphore_set_ready()
+
+    state = shmem["SEM_P"]
+
+    self.assertIsInstance(state, dict)
+    self.assertIn("is_ready", state)
+    self.assertTrue(state["is_ready"])
+    self.assertEqual(state["env"]["SEM_P_HOST"], "10.0.0.1")
+    self.assertEqual(set(state.keys()), {"is_ready", "env", "metadata"})
+    self.assertEqual(dict(state.items())["metadata"]["plugin_signature"], "_Harness")
+    self.assertEqual(state.get("metadata", {})["instance_id"], "inst")
+    self.assertEqual(json.loads(json.dumps(state))["env"]["HOST"], "10.0.0.1")
+
+    # external writers using the dict layout are seen by the mixin
+    state["is_ready"] = False
+    self.assertFalse(_Harness({"SEMAPHORED_KEYS": ["SEM_P"]}, plugins_shmem=shmem).semaphore_is_ready())
+
+  def test_consumer_accepts_externally_written_dict_entries(self):
+    shmem = {
+      "SEM_EXT": {"is_ready": True, "env": {"PORT": "1"}},
+      "SEM_BARE": {"is_ready": True},
+    }
+    consumer = _Harness({"SEMAPHORED_KEYS": ["SEM_EXT", "SEM_BARE"]}, plugins_shmem=shmem)
+
+    self.assertTrue(consumer.semaphore_all_ready_fast())
+    self.assertTrue(consumer.semaphore_is_ready("SEM_BARE"))
+    self.assertTrue(consumer.semaphore_check_with_logging())
+    self.assertEqual(consumer.semaphore_get_env(), {"PORT": "1"})
+    self.assertEqual(consumer.semaphore_get_env_value("SEM_BARE", "PORT", "none"), "none")
+    self.assertEqual(consumer.semaphore_get_env_value_by_path("SEM_EXT_PORT"), "1")
+    status = consumer.semaphore_get_status()
+    self.assertEqual(status["SEM_EXT"]["env_count"], 1)
+    self.assertIsNone(status["SEM_BARE"]["provider"])
+
+
+if __name__ == "__main__":
+  unittest.main()
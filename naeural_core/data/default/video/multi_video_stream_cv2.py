@@ -10,6 +10,10 @@ per-stream behaviour identical to the single-stream version while:
 * Exposing metadata per captured frame that identifies the originating source.
 * Feeding downstream consumers with batched inputs containing one entry per
   active stream.
+* Keeping no per-stream frame history: each acquisition step reads the newest
+  frame of every connected stream and, with `LIVE_FEED` (default), the shared
+  input deque holds a single step, so older frames are dropped rather than
+  accumulated.
 
 The implementation mirrors the single-stream DCT as closely as possible so the
 overall heuristics (AMD timing, crop/resize, notifications) behave the same for
@@ -19,6 +23,7 @@ each individual stream.
 from __future__ import annotations
 
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from threading import Lock, Thread
 from typing import Dict, Iterable, List, Optional
@@ -45,6 +50,9 @@ class _StreamContext:
   nr_connection_issues: int = 0
   crt_frame: int = 0
   configured_size_error: bool = False
+  configured_hw: Optional[tuple] = None
+  frame_metadata: Optional[Dict] = field(default=None, repr=False)
+  timer_ids: Dict[tuple, str] = field(default_factory=dict, repr=False)
   resize_hw: Optional[tuple] = None
   frame_crop: Optional[List[int]] = None
   reconnect_thread: Optional[Thread] = field(default=None, repr=False)
@@ -52,6 +60,12 @@ class _StreamContext:
   lock: Lock = field(default_factory=Lock, repr=False)
 
 
+_MISSING = object()
+
+_MAX_RELEASE_WORKERS = 32
+_RELEASE_TIMEOUT = 5  # seconds to wait for all stream captures to be released
+
+
 def _ensure_positive_randint_bounds(base_val: int) -> int:
   base_val = int(base_val)
   return max(1, base_val)
@@ -98,6 +112,9 @@ _CONFIG = {
 class MultiVideoStreamCv2DataCapture(DataCaptureThread):
   CONFIG = _CONFIG
 
+  # `KEY` -> `cfg_key` handler names, shared by all instances
+  _STREAM_CFG_ATTR_NAMES: Dict[str, str] = {}
+
   def __init__(self, **kwargs):
     self._streams: Dict[str, _StreamContext] = {}
     self._streams_lock = Lock()
@@ -108,9 +125,9 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
   def startup(self):
     super().startup()
     self._update_global_metadata()
-    new_contexts = self._sync_streams()
-    for ctx in new_contexts:
-      self._launch_reconnect(ctx)
+    # only register the stream contexts here; `startup` runs inside the constructor
+    # so the connection workers are launched from `_init` on the capture thread
+    self._sync_streams()
     return
 
   def _init(self):
@@ -118,11 +135,13 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
       str_err = "Cannot start MultiVideoStreamCv2DataCapture without CAP_RESOLUTION!"
       self.P(str_err, color="error")
       raise ValueError(str_err)
+    for ctx in self._get_streams_snapshot():
+      self._launch_reconnect(ctx)
     return
 
   @property
   def is_hw_error(self):
-    return any(ctx.configured_size_error for ctx in self._streams.values())
+    return any(ctx.configured_size_error for ctx in self._get_streams_snapshot())
 
   def is_intel(self):
     if self.cfg_simulate_amd:
@@ -136,22 +155,45 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     return result
 
   def _release(self):
+    # detach all contexts first so the (possibly slow) capture teardown runs
+    # outside `_streams_lock` and does not block metadata/status readers
     with self._streams_lock:
-      for ctx in list(self._streams.values()):
-        self._release_stream(ctx)
+      contexts = list(self._streams.values())
       self._streams.clear()
+    self._release_streams(contexts)
+    return
+
+  def _release_streams(self, contexts: List[_StreamContext]):
+    if len(contexts) <= 1:
+      for ctx in contexts:
+        self._release_stream(ctx)
+      return
+
+    # `capture.release()` may block on network sources (RTSP/ffmpeg teardown) so
+    # streams are released concurrently: shutdown costs the slowest stream, not the sum
+    executor = ThreadPoolExecutor(
+      max_workers=min(len(contexts), _MAX_RELEASE_WORKERS),
+      thread_name_prefix=f"{ct.THREADS_PREFIX}release_{self.sanitize_name(self.cfg_name)}",
+    )
+    futures = {executor.submit(self._release_stream, ctx): ctx for ctx in contexts}
+    try:
+      done, not_done = wait(futures, timeout=_RELEASE_TIMEOUT)
+      for future in done:
+        exc = future.exception()
+        if exc is not None:
+          self.P(f"[{futures[future].name}] Error while releasing stream: {exc}", color="r")
+      for future in not_done:
+        self.P(
+          f"[{futures[future].name}] Stream release did not finish in {_RELEASE_TIMEOUT}s; continuing shutdown.",
+          color="r",
+        )
+    finally:
+      executor.shutdown(wait=False)
     return
 
   def _release_stream(self, stream: _StreamContext):
     stream.active = False
-    with stream.lock:
-      if stream.capture is not None:
-        try:
-          stream.capture.release()
-        except Exception:
-          pass
-        stream.capture = None
-      stream.has_connection = False
+    self._release_stream_capture(stream)
     stream.reconnecting = False
     stream.reconnect_thread = None
     return
@@ -169,6 +211,7 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
 
     normalized: List[tuple] = []
     used_names = set()
+    dct_name = self.cfg_name
     for idx, raw_cfg in enumerate(sources):
       if isinstance(raw_cfg, str):
         cfg = {"URL": raw_cfg}
@@ -183,7 +226,7 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
         self.P(f"Ignoring source at index {idx} due to missing URL", color="r")
         continue
 
-      proposed_name = cfg.get("NAME") or f"{self.cfg_name}_src_{idx}"
+      proposed_name = cfg.get("NAME") or f"{dct_name}_src_{idx}"
       name = proposed_name
       suffix = 1
       while name in used_names:
@@ -193,6 +236,7 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
       normalized.append((name, idx, cfg, url))
 
     new_contexts: List[_StreamContext] = []
+    removed_contexts: List[_StreamContext] = []
     with self._streams_lock:
       existing_names = set(self._streams.keys())
       normalized_names = {name for name, _, _, _ in normalized}
@@ -200,8 +244,10 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
       removed_names = existing_names - normalized_names
       for name in removed_names:
         ctx = self._streams.pop(name)
+        # stop the reconnect worker right away, the capture is released below
+        ctx.active = False
+        removed_contexts.append(ctx)
         self.P(f"Removing video source '{name}'", color="y")
-        self._release_stream(ctx)
 
       for name, idx, cfg, url in normalized:
         if name not in self._streams:
@@ -215,7 +261,9 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
           ctx.index = idx
           ctx.config = cfg
           ctx.url = url
+          ctx.configured_hw = None
           ctx.metadata.update(stream_index=idx, url=url)
+          ctx.frame_metadata = None
           if ctx.last_url is not None and ctx.last_url != url:
             self.P(
               f"[{name}] URL change detected from {ctx.last_url} to {url}, scheduling reconnect...",
@@ -223,6 +271,9 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
             )
             self._mark_stream_disconnected(ctx, force_reconnect=True)
 
+    # removed streams are already detached, so their (possibly slow) teardown
+    # runs concurrently and outside `_streams_lock`
+    self._release_streams(removed_contexts)
     self._update_global_metadata()
     return new_contexts
 
@@ -277,7 +328,12 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
       nr_retry = 0
       round_info = None
       while nr_retry <= max_retries and not self._stop and stream.active and not stream.has_connection:
-        self.sleep(1)
+        if stream.nr_connection_issues > 0:
+          # back off before every attempt except the very first connect of the
+          # stream: each stream connects on its own worker, so the initial open
+          # should not delay startup, while retries and reconnects after read
+          # failures must not spin on a source that opens but cannot be read
+          self.sleep(1)
         nr_retry += 1
         stream.nr_connection_issues += 1
         try:
@@ -313,6 +369,8 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
             stream.last_url = stream.url
             stream.crt_frame = 0
             stream.configured_size_error = False
+            stream.configured_hw = None
+            stream.frame_metadata = None
             stream.resize_hw = None
             stream.frame_crop = None
             stream.metadata.update(
@@ -411,14 +469,24 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     return cap
 
   def _get_stream_cfg_value(self, stream: _StreamContext, key: str, default=None):
-    if key in stream.config and stream.config[key] is not None:
-      return stream.config[key]
-    attr_name = f"cfg_{key.lower()}"
-    if hasattr(self, attr_name):
-      return getattr(self, attr_name)
+    value = stream.config.get(key)
+    if value is not None:
+      return value
+    # resolve the `cfg_*` handler name once per key for all instances; the lookup
+    # runs per frame (configured size checks) and per connect attempt
+    attr_name = self._STREAM_CFG_ATTR_NAMES.get(key)
+    if attr_name is None:
+      attr_name = f"cfg_{key.lower()}"
+      self._STREAM_CFG_ATTR_NAMES[key] = attr_name
+    # single getattr instead of hasattr + getattr: each access runs the cfg property
+    value = getattr(self, attr_name, _MISSING)
+    if value is not _MISSING:
+      return value
     return self.config.get(key, default)
 
   def _get_streams_snapshot(self) -> Iterable[_StreamContext]:
+    # `_streams` is mutated by config sync and release on other threads, so it
+    # must never be iterated directly outside `_streams_lock`
     with self._streams_lock:
       return list(self._streams.values())
 
@@ -442,7 +510,12 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
         continue
 
       frame = self._maybe_resize_crop_stream(stream, frame)
-      frame = np.ascontiguousarray(frame[:, :, ::-1])
+      if frame.ndim == 3 and frame.shape[2] == 3:
+        # single pass BGR->RGB into a new contiguous buffer (no reversed view + copy)
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+      else:
+        # grayscale / BGRA sources keep the previous channel-reversal behavior
+        frame = np.ascontiguousarray(frame[:, :, ::-1])
 
       self._verify_configured_size(stream, frame)
 
@@ -454,13 +527,24 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     if inputs:
       self._add_inputs(inputs)
       self.has_connection = True
-    elif not any(ctx.has_connection for ctx in self._streams.values()):
+    elif not any(ctx.has_connection for ctx in self._get_streams_snapshot()):
       self.has_connection = False
     return
 
+  def _get_stream_configured_hw(self, stream: _StreamContext):
+    # resolved once per connection / config sync and kept on the stream context so
+    # the per-frame size check is a plain attribute read instead of two cfg lookups
+    configured_hw = stream.configured_hw
+    if configured_hw is None:
+      configured_hw = (
+        self._get_stream_cfg_value(stream, "CONFIGURED_H", self.cfg_configured_h),
+        self._get_stream_cfg_value(stream, "CONFIGURED_W", self.cfg_configured_w),
+      )
+      stream.configured_hw = configured_hw
+    return configured_hw
+
   def _verify_configured_size(self, stream: _StreamContext, frame):
-    configured_h = self._get_stream_cfg_value(stream, "CONFIGURED_H", self.cfg_configured_h)
-    configured_w = self._get_stream_cfg_value(stream, "CONFIGURED_W", self.cfg_configured_w)
+    configured_h, configured_w = self._get_stream_configured_hw(stream)
 
     mismatch_h = configured_h > 0 and configured_h != frame.shape[0]
     mismatch_w = configured_w > 0 and configured_w != frame.shape[1]
@@ -478,11 +562,20 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     return
 
   def _build_frame_metadata(self, stream: _StreamContext):
-    data = self.deepcopy(stream.metadata.__dict__)
+    # the stream metadata only changes on config sync / (re)connect / resize-crop setup,
+    # which reset `frame_metadata`; per frame only a shallow copy is made
+    base = stream.frame_metadata
+    if base is None:
+      base = self.deepcopy(stream.metadata.__dict__)
+      base.update(
+        source_name=stream.name,
+        source_index=stream.index,
+        source_url=stream.url,
+      )
+      stream.frame_metadata = base
+    data = dict(base)
     data.update(
-      source_name=stream.name,
-      source_index=stream.index,
-      source_url=stream.url,
+      frame_current=stream.crt_frame,
       connected=stream.has_connection,
     )
     return data
@@ -490,14 +583,16 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
   def _maybe_resize_crop_stream(self, stream: _StreamContext, img):
     if stream.resize_hw is not None:
       target_h, target_w = stream.resize_hw
-      self.start_timer(self._stream_timer_id(stream, "cv2_resize"))
+      timer_id = self._stream_timer_id(stream, "cv2_resize")
+      self.start_timer(timer_id)
       img = cv2.resize(img, dsize=(target_w, target_h))
-      self.end_timer(self._stream_timer_id(stream, "cv2_resize"))
+      self.end_timer(timer_id)
     elif stream.frame_crop is not None:
-      self.start_timer(self._stream_timer_id(stream, "cv2_crop"))
+      timer_id = self._stream_timer_id(stream, "cv2_crop")
+      self.start_timer(timer_id)
       top, left, bottom, right = stream.frame_crop
       img = img[top:bottom, left:right]
-      self.end_timer(self._stream_timer_id(stream, "cv2_crop"))
+      self.end_timer(timer_id)
     return img
 
   def _configure_stream_resize_crop(self, stream: _StreamContext, height: int, width: int):
@@ -547,44 +642,57 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
           f"[{stream.name}] Invalid FRAME_CROP {frame_crop}. Using original frame size.",
           color="r",
         )
+    stream.frame_metadata = None
     return
 
   def _capture_read(self, stream: _StreamContext, capture):
     has_frame, frame = False, None
-    timer_suffix = self._stream_timer_id(stream, "cv2")
-
-    if ((self.cap_resolution >= self._get_stream_fps_max_thr(stream) and self.cfg_amd_target_dps == 0)
-        or self.is_intel()):
-      self.start_timer(f"{timer_suffix}_read")
-      self.start_timer(f"{timer_suffix}_read_dps{self.cap_resolution}")
+    cap_resolution = self.cap_resolution
+    is_intel = self.is_intel()
+
+    if ((cap_resolution >= self._get_stream_fps_max_thr(stream) and self.cfg_amd_target_dps == 0)
+        or is_intel):
+      timer_read = self._stream_timer_id(stream, "cv2", "_read")
+      timer_read_dps = self._stream_timer_id(stream, "cv2", "_read_dps", cap_resolution)
+      self.start_timer(timer_read)
+      self.start_timer(timer_read_dps)
       has_frame, frame = capture.read()
-      self.end_timer(f"{timer_suffix}_read_dps{self.cap_resolution}")
-      self.end_timer(f"{timer_suffix}_read")
+      self.end_timer(timer_read_dps)
+      self.end_timer(timer_read)
     else:
       nr_grabs = self._get_nr_grabs(stream)
-      self.start_timer(f"{timer_suffix}_grab_retrv_dps{self.cap_resolution}")
-      self.start_timer(f"{timer_suffix}_grab_x{nr_grabs}")
+      timer_grab_retrv_dps = self._stream_timer_id(stream, "cv2", "_grab_retrv_dps", cap_resolution)
+      timer_grab_x = self._stream_timer_id(stream, "cv2", "_grab_x", nr_grabs)
+      timer_grab = self._stream_timer_id(stream, "cv2", "_grab")
+      timer_retrieve = self._stream_timer_id(stream, "cv2", "_retrieve")
+      self.start_timer(timer_grab_retrv_dps)
+      self.start_timer(timer_grab_x)
       for _ in range(nr_grabs):
-        self.start_timer(f"{timer_suffix}_grab")
+        self.start_timer(timer_grab)
         try:
           _ = capture.grab()
         except Exception:
-          self.end_timer(f"{timer_suffix}_grab")
+          self.end_timer(timer_grab)
           break
-        self.end_timer(f"{timer_suffix}_grab")
-      self.end_timer(f"{timer_suffix}_grab_x{nr_grabs}")
-      self.start_timer(f"{timer_suffix}_retrieve")
+        self.end_timer(timer_grab)
+      self.end_timer(timer_grab_x)
+      self.start_timer(timer_retrieve)
       has_frame, frame = capture.retrieve()
-      self.end_timer(f"{timer_suffix}_retrieve")
-      self.end_timer(f"{timer_suffix}_grab_retrv_dps{self.cap_resolution}")
+      self.end_timer(timer_retrieve)
+      self.end_timer(timer_grab_retrv_dps)
 
-    if not self.is_intel() and self.cfg_amd_target_dps == 0:
+    if not is_intel and self.cfg_amd_target_dps == 0:
       self._recalc_cap_resolution(stream)
     return has_frame, frame
 
-  def _stream_timer_id(self, stream: _StreamContext, base: str) -> str:
-    suffix = self.sanitize_name(stream.name)
-    return f"{base}__{suffix}"
+  def _stream_timer_id(self, stream: _StreamContext, base: str, *suffix) -> str:
+    # timer ids are built once per stream and suffix values instead of on every frame
+    key = (base,) + suffix
+    timer_id = stream.timer_ids.get(key)
+    if timer_id is None:
+      timer_id = f"{base}__{self.sanitize_name(stream.name)}" + "".join(str(x) for x in suffix)
+      stream.timer_ids[key] = timer_id
+    return timer_id
 
   def _get_stream_fps_max_thr(self, stream: _StreamContext):
     fps = stream.metadata.__dict__.get("fps")
@@ -608,7 +716,7 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     MAX_TIME = 2
     if self.cap_resolution >= fps * 0.6:
       nr_streams = self.get_nr_parallel_captures() + len(self._streams)
-      timer_id = f"{self._stream_timer_id(stream, 'cv2')}_read"
+      timer_id = self._stream_timer_id(stream, "cv2", "_read")
       read_stats = self.get_timer(timer_id)
       if read_stats is None:
         return
@@ -617,8 +725,12 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
       if read_count > (self.cap_resolution * WARM_UP_SEC):
         total_read_time = read_time * self.cap_resolution * nr_streams
         if total_read_time >= MAX_TIME:
+          heuristic_cap_resolution = round(MAX_TIME / (read_time * nr_streams), 1)
+          if heuristic_cap_resolution == self._heuristic_cap_resolution:
+            # the check runs on every frame once warmed up; only log when the forced value changes
+            return
           configured_cap_res = self.get_cap_or_forced_resolution()
-          self._heuristic_cap_resolution = round(MAX_TIME / (read_time * nr_streams), 1)
+          self._heuristic_cap_resolution = heuristic_cap_resolution
           self.P(
             "Total cv2r time @{} load: {:.4f}s({:.4f}s/strm/itr) exceding {}s. "
             "Forcing cap {} @ {:.1f} dps, nr_grabs={} (stream fps: {} cap dps:{}/{})".format(
@@ -658,18 +770,19 @@ class MultiVideoStreamCv2DataCapture(DataCaptureThread):
     return
 
   def _update_global_metadata(self):
+    contexts = self._get_streams_snapshot()
     streams_snapshot = {
-      name: self.deepcopy(ctx.metadata.__dict__)
-      for name, ctx in self._streams.items()
+      ctx.name: self.deepcopy(ctx.metadata.__dict__)
+      for ctx in contexts
     }
-    active_names = [name for name, ctx in self._streams.items() if ctx.has_connection]
+    active_names = [ctx.name for ctx in contexts if ctx.has_connection]
     self._metadata.update(streams=streams_snapshot, connected_streams=active_names)
     self._stream_metadata.streams = streams_snapshot
     self._stream_metadata.connected_streams = active_names
     return
 
   def _update_global_connection_flags(self):
-    total_issues = sum(ctx.nr_connection_issues for ctx in self._streams.values())
-    self.nr_connection_issues = total_issues
-    self.has_connection = any(ctx.has_connection for ctx in self._streams.values())
+    contexts = self._get_streams_snapshot()
+    self.nr_connection_issues = sum(ctx.nr_connection_issues for ctx in contexts)
+    self.has_connection = any(ctx.has_connection for ctx in contexts)
     return
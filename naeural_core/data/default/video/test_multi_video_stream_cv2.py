@@ -225,7 +225,7 @@ class MultiVideoStreamCv2Tests(unittest.TestCase):
 
     config = self._build_config()
 
-    with mock.patch("naeural_core.data.default.video.multi_vide_stream_cv2.cv2.VideoCapture", side_effect=factory), \
+    with mock.patch("naeural_core.data.default.video.multi_video_stream_cv2.cv2.VideoCapture", side_effect=factory), \
          mock.patch.object(MultiVideoStreamCv2DataCapture, "sleep", new=no_sleep):
       dct = MultiVideoStreamCv2DataCapture(
         log=self.logger,
@@ -240,6 +240,10 @@ class MultiVideoStreamCv2Tests(unittest.TestCase):
       dct.is_intel = lambda: True
 
       try:
+        # connections are started from `_init` on the capture thread, not the constructor
+        self.assertFalse(any(ctx.reconnecting for ctx in dct._streams.values()))
+        dct._init()
+
         self.assertTrue(wait_for(lambda: dct._streams["cam_a"].has_connection))
         self.assertFalse(dct._streams["cam_b"].has_connection)
 
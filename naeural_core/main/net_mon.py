@@ -23,6 +23,44 @@ UNUSEFULL_HB_KEYS = [
   ct.HB.ERROR_LOG,
   ct.HB.TIMERS,
 ]
+UNUSEFULL_HB_KEYS_SET = frozenset(UNUSEFULL_HB_KEYS)
+
+# heartbeat keys that only matter for the latest heartbeat of a node
+REPEATING_HB_KEYS = frozenset([
+  ct.HB.ACTIVE_PLUGINS,
+  ct.HB.CONFIG_STREAMS,
+  ct.HB.DCT_STATS,
+  ct.HB.COMM_STATS,
+  ct.HB.R1FS_ID,
+  ct.HB.R1FS_ONLINE,
+  ct.HB.EE_WHITELIST,
+  ct.PAYLOAD_DATA.EE_PAYLOAD_PATH,
+  ct.HB.TIMERS,
+  ct.HB.DEVICE_LOG,
+  ct.HB.ERROR_LOG,
+  ct.PAYLOAD_DATA.EE_VERSION,
+  ct.HB.LOGGER_VERSION,
+  ct.HB.VERSION,
+  ct.HB.PY_VER,
+  ct.HB.HEARTBEAT_VERSION,
+  ct.HB.GIT_BRANCH,
+  ct.HB.CONDA_ENV,
+  ct.HB.CPU,
+  ct.HB.CPU_NR_CORES,
+  ct.HB.DEFAULT_CUDA,
+  ct.HB.GPU_INFO,
+  ct.HB.MACHINE_IP,
+  ct.HB.SECURED,
+  ct.HB.EE_IS_SUPER,
+  ct.HB.DID,
+  ct.HB.R1FS_RELAY,
+  ct.HB.COMM_RELAY,
+  ct.PAYLOAD_DATA.EE_ID,
+  ct.PAYLOAD_DATA.INITIATOR_ID,
+  ct.PAYLOAD_DATA.EE_IS_ENCRYPTED,
+  ct.PAYLOAD_DATA.EE_EVENT_TYPE,
+  ct.PAYLOAD_DATA.EE_FORMATTER,
+])
 
 class NetMonCt:
   PIPELINES = 'pipelines'
@@ -66,6 +104,29 @@ def exponential_score(left, right, val, right_is_better=False, normed=False):
 #enddef
 
 
+def _parse_hb_timestamp(str_ts):
+  """
+  Parse a `ct.HB.TIMESTAMP_FORMAT` ("%Y-%m-%d %H:%M:%S.%f") heartbeat timestamp.
+
+  History interval scans parse one timestamp per stored heartbeat, so the
+  canonical 26-char form goes through the much cheaper `datetime.fromisoformat`
+  while anything else keeps the exact `strptime` semantics.
+  """
+  if (
+    len(str_ts) == 26 and str_ts.isascii()
+    and str_ts[4] == '-' and str_ts[7] == '-' and str_ts[10] == ' '
+    and str_ts[13] == ':' and str_ts[16] == ':' and str_ts[19] == '.'
+    and str_ts[20:].isdigit()
+  ):
+    # the gate leaves no room for the ISO extras `fromisoformat` would accept
+    # (UTC offsets, `Z`, week dates) and `strptime` rejects
+    try:
+      return dt.fromisoformat(str_ts)
+    except ValueError:
+      pass
+  return dt.strptime(str_ts, ct.HB.TIMESTAMP_FORMAT)
+
+
 def _safe_float(value, default=None, allow_negative=False):
   if value is None or isinstance(value, bool):
     return default
@@ -112,11 +173,19 @@ def _safe_str_list(value):
 
 NETMON_MUTEX = 'NETMON_MUTEX'
 
+# immutable leaf types that can be shared between stored heartbeats and callers
+HB_IMMUTABLE_VALUE_TYPES = (str, int, float, bool, type(None), bytes)
+
 NETMON_DB = 'db.pkl'
 NETMON_DB_SUBFOLDER = 'network_monitor'
 NETMON_DUPLICATE_TS_CHECK_LAST = 10
 
 ERROR_ADDRESS = '0xai_unknownunknownunknown'
+# case-insensitive address prefixes accepted in network summary snapshots
+SUMMARY_ADDR_PREFIXES = frozenset(("0xai_", "aixp_"))
+SUMMARY_ADDR_PREFIX_LEN = 5
+# upper bound for the per-instance address -> no-prefix address memo
+ADDR_NO_PREFIX_CACHE_SIZE = 4096
 MISSING_ID = 'missing_id'
 SUMMARY_NOT_SELECTED = object()
 SUMMARY_FIELD_MISSING = object()
@@ -151,6 +220,11 @@ class NetworkMonitor(DecentrAIObject):
     # end simple pipeline caching mechanism
     self.__epoch_manager = epoch_manager
     self.__blockchain_manager = blockchain_manager
+    self.__addr_no_prefix_cache = {}
+    # `network_node_get_tag_*` getters (including subclass ones), resolved once
+    self.__node_tag_getter_names = tuple(
+      name for name in dir(type(self)) if name.startswith("network_node_get_tag_")
+    )
     super(NetworkMonitor, self).__init__(log=log, prefix_log='[NMON]', **kwargs)    
     return
 
@@ -279,6 +353,7 @@ class NetworkMonitor(DecentrAIObject):
         name=self.node_name,
         config={}, # use default blockchain config
       )
+      self.__addr_no_prefix_cache = {}
 
     self.network_load_status()    
 
@@ -335,17 +410,25 @@ class NetworkMonitor(DecentrAIObject):
 
 
   def __remove_address_prefix(self, addr):
-    """Remove the address prefix if it exists"""
-    return self.__blockchain_manager.maybe_remove_prefix(addr)
+    """Remove the address prefix if it exists (memoized per address)"""
+    if not isinstance(addr, str):
+      return self.__blockchain_manager.maybe_remove_prefix(addr)
+    cache = self.__addr_no_prefix_cache
+    result = cache.get(addr)
+    if result is None:
+      result = self.__blockchain_manager.maybe_remove_prefix(addr)
+      if len(cache) >= ADDR_NO_PREFIX_CACHE_SIZE:
+        cache.clear()
+      cache[addr] = result
+    return result
 
 
   def __remove_summary_address_prefix(self, addr):
     if not isinstance(addr, str):
       return None
-    addr_lower = addr.lower()
-    for prefix in ("0xai_", "aixp_"):
-      if addr_lower.startswith(prefix):
-        return addr[len(prefix):]
+    # only the prefix needs the case-insensitive check, not the whole address
+    if addr[:SUMMARY_ADDR_PREFIX_LEN].lower() in SUMMARY_ADDR_PREFIXES:
+      return addr[SUMMARY_ADDR_PREFIX_LEN:]
     return self.__remove_address_prefix(addr)
   
   
@@ -360,45 +443,8 @@ class NetworkMonitor(DecentrAIObject):
 
   def __pop_repeating_info_from_heartbeat(self, hb):
     """This method will remove the extra info from the heartbeat that is not required for time series analysis"""
-    hb.pop(ct.HB.ACTIVE_PLUGINS, None)
-    hb.pop(ct.HB.CONFIG_STREAMS, None)
-    hb.pop(ct.HB.DCT_STATS, None)
-    hb.pop(ct.HB.COMM_STATS, None)
-    
-    hb.pop(ct.HB.R1FS_ID, None)
-    hb.pop(ct.HB.R1FS_ONLINE, None)
-
-    hb.pop(ct.HB.EE_WHITELIST, None)
-    hb.pop(ct.PAYLOAD_DATA.EE_PAYLOAD_PATH, None)
-
-    hb.pop(ct.HB.TIMERS, None)
-    hb.pop(ct.HB.DEVICE_LOG, None)
-    hb.pop(ct.HB.ERROR_LOG, None)
-
-    hb.pop(ct.PAYLOAD_DATA.EE_VERSION, None)
-    hb.pop(ct.HB.LOGGER_VERSION, None)
-    hb.pop(ct.HB.VERSION, None)
-    hb.pop(ct.HB.PY_VER, None)
-    hb.pop(ct.HB.HEARTBEAT_VERSION, None)
-
-    hb.pop(ct.HB.GIT_BRANCH, None)
-    hb.pop(ct.HB.CONDA_ENV, None)
-    hb.pop(ct.HB.CPU, None)
-    hb.pop(ct.HB.CPU_NR_CORES, None)
-    hb.pop(ct.HB.DEFAULT_CUDA, None)
-    hb.pop(ct.HB.GPU_INFO, None)
-    hb.pop(ct.HB.MACHINE_IP, None)
-    hb.pop(ct.HB.SECURED, None)
-    hb.pop(ct.HB.EE_IS_SUPER, None)
-    hb.pop(ct.HB.DID, None)
-    hb.pop(ct.HB.R1FS_RELAY, None)
-    hb.pop(ct.HB.COMM_RELAY, None)
-
-    hb.pop(ct.PAYLOAD_DATA.EE_ID, None)
-    hb.pop(ct.PAYLOAD_DATA.INITIATOR_ID, None)
-    hb.pop(ct.PAYLOAD_DATA.EE_IS_ENCRYPTED, None)
-    hb.pop(ct.PAYLOAD_DATA.EE_EVENT_TYPE, None)
-    hb.pop(ct.PAYLOAD_DATA.EE_FORMATTER, None)
+    for key in REPEATING_HB_KEYS:
+      hb.pop(key, None)
 
     # Pop all tags starting with EE_NT
     for key in list(hb.keys()):
@@ -406,9 +452,7 @@ class NetworkMonitor(DecentrAIObject):
         hb.pop(key, None)
     return
 
-  def __pop_repeating_info_from_previous_heartbeat(self, addr):
-    __addr_no_prefix = self.__remove_address_prefix(addr)
-    hb_deque = self.__network_heartbeats[__addr_no_prefix]
+  def __pop_repeating_info_from_previous_heartbeat(self, hb_deque):
     if len(hb_deque) < 2:
       return
     hb_deque[-2] = self.__build_compacted_history_heartbeat(hb_deque[-2])
@@ -422,13 +466,19 @@ class NetworkMonitor(DecentrAIObject):
     MQTT/communication code may still pass the original payload to other
     subsystems after netmon registration. Work on a local envelope copy so the
     compressed ``ENCODED_DATA`` field is not popped from caller-owned data.
+    The bulky ``UNUSEFULL_HB_KEYS`` are dropped while copying.
     """
-    hb_data = dict(data)
+    hb_data = {
+      key: value for key, value in data.items()
+      if key not in UNUSEFULL_HB_KEYS_SET
+    }
     owned_keys = set()
     missing = object()
     str_data = hb_data.pop(ct.HB.ENCODED_DATA, missing)
     if str_data is not missing:
       dct_hb = json.loads(self.log.decompress_text(str_data))
+      for key_to_delete in UNUSEFULL_HB_KEYS_SET:
+        dct_hb.pop(key_to_delete, None)
       hb_data.update(dct_hb)
       # json.loads creates fresh containers, so these values are already
       # detached from the communication payload and can be stored directly.
@@ -490,11 +540,15 @@ class NetworkMonitor(DecentrAIObject):
 
     For compressed heartbeats most large values come from freshly decoded JSON
     and are owned by this call. Only values inherited from the caller envelope
-    still need a deepcopy to preserve the old no-aliasing contract.
+    still need a deepcopy to preserve the old no-aliasing contract, and plain
+    immutable leaves are shared as-is since copying them is pure overhead.
     """
     owned_keys = owned_keys or set()
     return {
-      key: value if key in owned_keys else deepcopy(value)
+      key: (
+        value if key in owned_keys or type(value) in HB_IMMUTABLE_VALUE_TYPES
+        else deepcopy(value)
+      )
       for key, value in hb.items()
     }
 
@@ -504,15 +558,15 @@ class NetworkMonitor(DecentrAIObject):
     Return a compacted replacement for a historical heartbeat.
 
     Do not mutate the existing stored dict in-place: readers may already hold a
-    reference returned by ``network_node_last_heartbeat`` / history helpers. A
-    shallow dict copy lets us drop bulky keys cheaply, then we only deepcopy the
-    smaller retained values to avoid sharing nested objects with old readers.
+    reference returned by ``network_node_last_heartbeat`` / history helpers. The
+    replacement is built in a single pass that skips the repeating keys, and
+    only the retained nested values are deep-copied so old readers keep theirs.
     """
-    hb_compact = dict(hb)
-    self.__pop_repeating_info_from_heartbeat(hb_compact)
+    nodetag_prefix = ct.HB.PREFIX_EE_NODETAG
     return {
-      key: deepcopy(value)
-      for key, value in hb_compact.items()
+      key: value if type(value) in HB_IMMUTABLE_VALUE_TYPES else deepcopy(value)
+      for key, value in hb.items()
+      if key not in REPEATING_HB_KEYS and not (key and key.startswith(nodetag_prefix))
     }
   
   
@@ -579,6 +633,62 @@ class NetworkMonitor(DecentrAIObject):
       The decoded heartbeat view when the heartbeat is accepted and stored.
       None when it is rejected or dropped as a recent duplicate.
     """
+    if local_timezone is None and not local_owner_only and self.__is_last_stored_heartbeat(addr, data):
+      # local paths canonicalize EE_TIMESTAMP while preparing, so only remote
+      # heartbeats can be matched before decoding
+      return None
+    prepared = self.__prepare_heartbeat_for_storage(
+      addr,
+      data,
+      update_received_time=update_received_time,
+      local_timezone=local_timezone,
+      local_owner_only=local_owner_only,
+    )
+    if prepared is None:
+      return None
+    with self.log.managed_lock_resource(NETMON_MUTEX):
+      return self.__store_prepared_heartbeat(addr, *prepared)
+
+
+  def __is_last_stored_heartbeat(self, addr, data):
+    """
+    Cheap duplicate pre-check run before a heartbeat is decoded and snapshotted.
+
+    Redelivered MQTT QoS 1 heartbeats usually repeat the latest stored one, so
+    the transport EE_TIMESTAMP of the (possibly still compressed) envelope is
+    compared with the last stored heartbeat of the node only. The lookup is
+    lock-free (single dict/deque reads are atomic); it may miss duplicates but
+    the authoritative window check in `__store_prepared_heartbeat` still runs
+    under NETMON_MUTEX.
+    """
+    remote_ts = data.get(ct.PAYLOAD_DATA.EE_TIMESTAMP)
+    if remote_ts is None or self.__network_heartbeats is None:
+      return False
+    hb_deque = self.__network_heartbeats.get(self.__remove_address_prefix(addr))
+    try:
+      last_hb = hb_deque[-1]
+    except (TypeError, IndexError):
+      return False
+    return last_hb.get(ct.PAYLOAD_DATA.EE_TIMESTAMP) == remote_ts
+
+
+  def __prepare_heartbeat_for_storage(
+    self,
+    addr,
+    data,
+    update_received_time=True,
+    local_timezone=None,
+    local_owner_only=False,
+  ):
+    """
+    Decode, validate and snapshot a heartbeat without taking NETMON_MUTEX.
+
+    Returns
+    -------
+    tuple or None
+      ``(data, hb_work, addr_no_prefix, eeid)`` for `__store_prepared_heartbeat`
+      or None when the heartbeat is rejected.
+    """
     has_encoded_data = ct.HB.ENCODED_DATA in data
     if local_owner_only:
       try:
@@ -602,43 +712,53 @@ class NetworkMonitor(DecentrAIObject):
     __eeid = data.get(ct.EE_ID, MISSING_ID)
     __addr_no_prefix = self.__remove_address_prefix(addr) 
     
-    # we remove any extra bloaded info from the HB inside the network monitor
-    for key_to_delete in UNUSEFULL_HB_KEYS:
-      data.pop(key_to_delete, None)
-    # end remove
+    # any extra bloated info (UNUSEFULL_HB_KEYS) was already dropped while
+    # decoding the HB into the network monitor's own copy
+
+    # Store a detached snapshot. For normal compressed heartbeats this avoids
+    # deep-copying the freshly decoded payload while still protecting against
+    # caller-owned envelope objects being mutated elsewhere. It only depends on
+    # the incoming data so it is built before taking NETMON_MUTEX, keeping the
+    # copy work out of the window where readers of every node are blocked.
+    hb_work = self.__build_hb_storage_snapshot(data, owned_keys=owned_keys)
+    if update_received_time:
+      # save the timestamp when received the heartbeat,
+      # helpful to know when computing the availability score
+      # this data is saved using the local time and could "appear" different
+      # from the timestamp in the heartbeat due to zone differences
+      # when reconstructing RECEIVED_TIME we will use local timezone
+      hb_work[ct.HB.RECEIVED_TIME] = dt.now().strftime(ct.HB.TIMESTAMP_FORMAT)
+    return data, hb_work, __addr_no_prefix, __eeid
+
+
+  def __store_prepared_heartbeat(self, addr, data, hb_work, addr_no_prefix, eeid):
+    """
+    Append a prepared heartbeat to the node history. Caller must hold NETMON_MUTEX.
 
-    with self.log.managed_lock_resource(NETMON_MUTEX):
-      if __addr_no_prefix not in self.__network_heartbeats:
-        self.P("Box alive: {}:{}.".format(addr, __eeid), color='y')
-        self.__network_heartbeats[__addr_no_prefix] = deque(maxlen=self.HB_HISTORY)
-      #endif
-      hb_deque = self.__network_heartbeats[__addr_no_prefix]
-      remote_ts = data.get(ct.PAYLOAD_DATA.EE_TIMESTAMP)
-      if remote_ts is not None:
-        # Check a small recent window for duplicated MQTT QoS 1 deliveries.
-        # Looking back 10 heartbeats is conservative safety and likely more than
-        # strictly necessary, but it avoids maintaining extra dedup state.
-        for prev_hb in islice(reversed(hb_deque), NETMON_DUPLICATE_TS_CHECK_LAST):
-          if prev_hb.get(ct.PAYLOAD_DATA.EE_TIMESTAMP) == remote_ts:
-            return None
-      # Store a detached snapshot. For normal compressed heartbeats this avoids
-      # deep-copying the freshly decoded payload while still protecting against
-      # caller-owned envelope objects being mutated elsewhere.
-      hb_work = self.__build_hb_storage_snapshot(data, owned_keys=owned_keys)
-      if update_received_time:
-        # save the timestamp when received the heartbeat,
-        # helpful to know when computing the availability score
-        # this data is saved using the local time and could "appear" different
-        # from the timestamp in the heartbeat due to zone differences
-        # when reconstructing RECEIVED_TIME we will use local timezone
-        hb_work[ct.HB.RECEIVED_TIME] = dt.now().strftime(ct.HB.TIMESTAMP_FORMAT)
-      # now register pipelines if avail (will pop from hb_work)
-      self.__maybe_register_hb_pipelines(addr, hb_work)
-      hb_deque.append(hb_work)
-      # now remove the extra info from the previous heartbeat
-      # this is done to avoid having the same info in multiple sequential heartbeats
-      self.__pop_repeating_info_from_previous_heartbeat(addr)
-    # endwith lock
+    Returns
+    -------
+    dict or None
+      The decoded heartbeat view, or None when dropped as a recent duplicate.
+    """
+    if addr_no_prefix not in self.__network_heartbeats:
+      self.P("Box alive: {}:{}.".format(addr, eeid), color='y')
+      self.__network_heartbeats[addr_no_prefix] = deque(maxlen=self.HB_HISTORY)
+    #endif
+    hb_deque = self.__network_heartbeats[addr_no_prefix]
+    remote_ts = data.get(ct.PAYLOAD_DATA.EE_TIMESTAMP)
+    if remote_ts is not None:
+      # Check a small recent window for duplicated MQTT QoS 1 deliveries.
+      # Looking back 10 heartbeats is conservative safety and likely more than
+      # strictly necessary, but it avoids maintaining extra dedup state.
+      for prev_hb in islice(reversed(hb_deque), NETMON_DUPLICATE_TS_CHECK_LAST):
+        if prev_hb.get(ct.PAYLOAD_DATA.EE_TIMESTAMP) == remote_ts:
+          return None
+    # now register pipelines if avail (will pop from hb_work)
+    self.__maybe_register_hb_pipelines(addr, hb_work)
+    hb_deque.append(hb_work)
+    # now remove the extra info from the previous heartbeat
+    # this is done to avoid having the same info in multiple sequential heartbeats
+    self.__pop_repeating_info_from_previous_heartbeat(hb_deque)
     return data
 
 
@@ -726,7 +846,7 @@ class NetworkMonitor(DecentrAIObject):
           remote_tz = heartbeat.get(ct.PAYLOAD_DATA.EE_TIMEZONE)
           ts = self.log.utc_to_local(remote_time, remote_utc=remote_tz, fmt=ct.HB.TIMESTAMP_FORMAT)
         else:
-          ts = dt.strptime(ts, ct.HB.TIMESTAMP_FORMAT)
+          ts = _parse_hb_timestamp(ts)
         passed_minutes = (dt_now - ts).total_seconds() / 60.0
         if passed_minutes < 0 or passed_minutes > minutes:
           break
@@ -1259,6 +1379,48 @@ class NetworkMonitor(DecentrAIObject):
         self.epoch_manager.register_data(addr, epoch_data)
       return
 
+    def register_heartbeats(self, heartbeats):
+      """
+      Register a burst of remote heartbeats with a single NETMON_MUTEX acquisition.
+
+      Parameters
+      ----------
+      heartbeats : list[tuple[str, dict]]
+        ``(addr, data)`` pairs in arrival order.
+
+      Returns
+      -------
+      int
+        Number of heartbeats stored (duplicates are dropped as in
+        `register_heartbeat`). A malformed heartbeat is logged and skipped
+        without dropping the rest of the batch.
+      """
+      prepared = []
+      for addr, data in heartbeats:
+        try:
+          if self.__is_last_stored_heartbeat(addr, data):
+            continue
+          item = self.__prepare_heartbeat_for_storage(addr, data, update_received_time=True)
+        except Exception as exc:
+          self.P(f"Ignoring malformed heartbeat from {addr} in batch: {exc}", color='r')
+          continue
+        if item is not None:
+          prepared.append((addr, item))
+      accepted = []
+      with self.log.managed_lock_resource(NETMON_MUTEX):
+        for addr, item in prepared:
+          try:
+            epoch_data = self.__store_prepared_heartbeat(addr, *item)
+          except Exception as exc:
+            self.P(f"Failed to store heartbeat from {addr} in batch: {exc}", color='r')
+            continue
+          if epoch_data is not None:
+            accepted.append((addr, epoch_data))
+      # epochs are fed outside the lock, same as the single heartbeat path
+      for addr, epoch_data in accepted:
+        self.epoch_manager.register_data(addr, epoch_data)
+      return len(accepted)
+
     def register_local_heartbeat(self, addr, data):
       """
       Register this node's own heartbeat for local status and epoch accounting.
@@ -3338,7 +3500,11 @@ class NetworkMonitor(DecentrAIObject):
         return []
 
       result = []
-      hb = self.__network_node_last_heartbeat(node_address, return_copy=True)
+      # Stored heartbeats are never mutated after they are appended (pipelines
+      # are popped before storage and compaction swaps in a new dict), and tags
+      # are only read here, so the live latest heartbeat is used without the
+      # full deepcopy a public snapshot needs.
+      hb = self.__network_node_last_heartbeat(node_address)
       # get tags from HB.
       if isinstance(hb, dict):
         tags = {k: v for k, v in hb.items() if k.startswith(ct.HB.PREFIX_EE_NODETAG)}
@@ -3351,17 +3517,15 @@ class NetworkMonitor(DecentrAIObject):
       # get remaining tags that are not in HB (from DB or other source).
       other_tags = []
 
-      for method_name in dir(self):
-        if method_name.startswith(f"network_node_get_tag_"):
-          tag_name = method_name.replace("network_node_get_tag_", "").upper()
-          _method = getattr(self, method_name)
-          if callable(_method):
-            try:
-              tag = _method(addr=node_address, only_value=False)
-              if tag:
-                other_tags.append(tag)
-            except Exception as e:
-              self.P(f"Error getting tag by calling _method {method_name}: {e}", color='r')
+      for method_name in self.__node_tag_getter_names:
+        _method = getattr(self, method_name)
+        if callable(_method):
+          try:
+            tag = _method(addr=node_address, only_value=False)
+            if tag:
+              other_tags.append(tag)
+          except Exception as e:
+            self.P(f"Error getting tag by calling _method {method_name}: {e}", color='r')
       result = result + other_tags
       result = list(set(result))
 
@@ -20,15 +20,25 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
 import shutil
 import tempfile
 import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Union, Sequence
 
 Tree = Dict[str, List[Union["Tree", str]]]
 
+_DUMMY_FILE = b"# dummy file\n"
+_INIT_FILE = b"# auto-generated for test package\n"
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_MAX_WRITE_WORKERS = 16
+
 
 @dataclass
 class FakeOwner:
@@ -47,16 +57,12 @@ class FakeOwner:
     return {}
 
 
+@lru_cache(maxsize=4096)
 def camel_to_snake(s: str) -> str:
   # Mirror Logger.camel_to_snake behavior for deterministic file names.
   if s.isupper():
     return s.lower()
-  out = ""
-  for i, ch in enumerate(s):
-    if ch.isupper() and i > 0:
-      out += "_"
-    out += ch.lower()
-  return out.replace("__", "_")
+  return _CAMEL_RE.sub("_", s).lower().replace("__", "_")
 
 
 def signature_to_class_name(signature: str, suffix: str) -> str:
@@ -65,48 +71,7 @@ def signature_to_class_name(signature: str, suffix: str) -> str:
   return f"{base}{suffix}"
 
 
-def ensure_init_py(path: str) -> None:
-  os.makedirs(path, exist_ok=True)
-  init_path = os.path.join(path, "__init__.py")
-  if not os.path.exists(init_path):
-    with open(init_path, "w", encoding="utf-8") as f:
-      f.write("# auto-generated for test package\n")
-
-
-def materialize_tree(tree: Tree, root: str) -> None:
-  for dirname, items in tree.items():
-    dir_path = os.path.join(root, dirname)
-    os.makedirs(dir_path, exist_ok=True)
-    # Make it package-like to allow importlib to find modules
-    ensure_init_py(dir_path)
-    for item in items:
-      if isinstance(item, dict):
-        materialize_tree(item, dir_path)
-      elif isinstance(item, str):
-        file_path = os.path.join(dir_path, item)
-        if not os.path.exists(file_path):
-          with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# dummy file\n")
-      else:
-        raise ValueError(f"Unsupported tree item type: {type(item)}")
-
-def count_locations(tree: Tree) -> int:
-  count = 0
-  for _, items in tree.items():
-    count += 1
-    for item in items:
-      if isinstance(item, dict):
-        count += count_locations(item)
-  return count
-
-
-def write_plugin_module(module_dir: str, signature: str, suffix: str,
-                        use_base_plugin: bool, use_cv_plugin: bool) -> str:
-  file_name = camel_to_snake(signature) + ".py"
-  class_name = signature_to_class_name(signature, suffix)
-  module_path = os.path.join(module_dir, file_name)
-  if use_cv_plugin:
-    code = f"""\
+_TPL_CV_PLUGIN = """\
 from naeural_core.business.base.cv_plugin_executor import CVPluginExecutor
 
 _CONFIG = CVPluginExecutor.CONFIG
@@ -118,8 +83,8 @@ class {class_name}(CVPluginExecutor):
     self.thread = None
     return
 """
-  elif use_base_plugin:
-    code = f"""\
+
+_TPL_BASE_PLUGIN = """\
 from naeural_core.business.base.base_plugin_biz import BasePluginExecutor
 
 _CONFIG = BasePluginExecutor.CONFIG
@@ -131,8 +96,8 @@ class {class_name}(BasePluginExecutor):
     self.thread = None
     return
 """
-  else:
-    code = f"""\
+
+_TPL_PLAIN_PLUGIN = """\
 _CONFIG = {{}}
 __VER__ = "0.0.0"
 
@@ -152,8 +117,73 @@ class {class_name}:
   def __repr__(self):
     return "{class_name}()"
 """
-  with open(module_path, "w", encoding="utf-8") as f:
-    f.write(code)
+
+
+def write_bytes(path: str, data: bytes) -> None:
+  # Raw fd write: no text-mode wrapper/encoder per (tiny) generated file.
+  fd = os.open(path, _WRITE_FLAGS, 0o644)
+  try:
+    os.write(fd, data)
+  finally:
+    os.close(fd)
+
+
+def create_bytes(path: str, data: bytes) -> None:
+  # Single O_EXCL open instead of an existence check followed by an open;
+  # files that already exist are left untouched.
+  try:
+    fd = os.open(path, _CREATE_FLAGS, 0o644)
+  except FileExistsError:
+    return
+  try:
+    os.write(fd, data)
+  finally:
+    os.close(fd)
+
+
+def ensure_init_py(path: str) -> None:
+  os.makedirs(path, exist_ok=True)
+  create_bytes(os.path.join(path, "__init__.py"), _INIT_FILE)
+
+
+def materialize_tree(tree: Tree, root: str) -> None:
+  for dirname, items in tree.items():
+    dir_path = os.path.join(root, dirname)
+    # Creates the directory and makes it package-like to allow importlib to find modules
+    ensure_init_py(dir_path)
+    for item in items:
+      if isinstance(item, dict):
+        materialize_tree(item, dir_path)
+      elif isinstance(item, str):
+        create_bytes(os.path.join(dir_path, item), _DUMMY_FILE)
+      else:
+        raise ValueError(f"Unsupported tree item type: {type(item)}")
+
+def count_locations(tree: Tree) -> int:
+  # Iterative walk: deep generated trees must not hit the recursion limit.
+  count = 0
+  stack = [tree]
+  while stack:
+    for _, items in stack.pop().items():
+      count += 1
+      for item in items:
+        if isinstance(item, dict):
+          stack.append(item)
+  return count
+
+
+def write_plugin_module(module_dir: str, signature: str, suffix: str,
+                        use_base_plugin: bool, use_cv_plugin: bool) -> str:
+  file_name = camel_to_snake(signature) + ".py"
+  class_name = signature_to_class_name(signature, suffix)
+  module_path = os.path.join(module_dir, file_name)
+  if use_cv_plugin:
+    template = _TPL_CV_PLUGIN
+  elif use_base_plugin:
+    template = _TPL_BASE_PLUGIN
+  else:
+    template = _TPL_PLAIN_PLUGIN
+  write_bytes(module_path, template.format(class_name=class_name).encode("utf-8"))
   return module_path
 
 
@@ -177,23 +207,21 @@ def build_instances_config(signatures: List[str], total_instances: int) -> list:
   plugins = []
   if not signatures:
     return plugins
-  per_sig = total_instances // len(signatures)
-  remainder = total_instances % len(signatures)
+  per_sig, remainder = divmod(total_instances, len(signatures))
+  # Bind constant keys once instead of resolving the attribute chains per instance
+  k_instance_id = ct.CONFIG_INSTANCE.K_INSTANCE_ID
+  k_signature = ct.CONFIG_PLUGIN.K_SIGNATURE
+  k_instances = ct.CONFIG_PLUGIN.K_INSTANCES
 
-  idx = 0
-  for sig in signatures:
+  for idx, sig in enumerate(signatures):
     n = per_sig + (1 if idx < remainder else 0)
-    idx += 1
-    instances = []
-    for j in range(n):
-      instance_id = f"{sig}_INST_{j+1:03d}"
-      instances.append({
-        ct.CONFIG_INSTANCE.K_INSTANCE_ID: instance_id,
-        "DISABLED": False,
-      })
+    instances = [
+      {k_instance_id: "%s_INST_%03d" % (sig, j + 1), "DISABLED": False}
+      for j in range(n)
+    ]
     plugins.append({
-      ct.CONFIG_PLUGIN.K_SIGNATURE: sig,
-      ct.CONFIG_PLUGIN.K_INSTANCES: instances,
+      k_signature: sig,
+      k_instances: instances,
     })
   random.shuffle(plugins)
   return plugins
@@ -222,7 +250,7 @@ def load_tree(path: str | None) -> Tree | None:
 def parse_signatures_csv(csv_value: str | None) -> List[str]:
   if not csv_value:
     return []
-  return [x.strip() for x in csv_value.split(",") if x.strip()]
+  return [x for x in (token.strip() for token in csv_value.split(",")) if x]
 
 def _build_file_names(count: int, exts: Sequence[str], prefix: str) -> List[str]:
   names: List[str] = []
@@ -238,23 +266,31 @@ def generate_tree(depth: int, dirs_per_level: int, files_per_dir: int,
   if depth <= 0:
     return {}
 
-  if full_breadth:
-    n_dirs = dirs_per_level
-    n_files = files_per_dir
-  else:
-    n_dirs = rng.randint(0, dirs_per_level)
-    n_files = rng.randint(0, files_per_dir)
+  # Iterative pre-order build with an explicit stack of (depth, level, parent, slot).
+  # Children are pushed in reverse so nodes consume `rng` in the same order as a
+  # recursive build, keeping trees for a given seed unchanged.
+  root: List[Tree | None] = [None]
+  stack = [(depth, level, root, 0)]
+  while stack:
+    crt_depth, crt_level, parent, slot = stack.pop()
+    if full_breadth:
+      n_dirs = dirs_per_level
+      n_files = files_per_dir
+    else:
+      n_dirs = rng.randint(0, dirs_per_level)
+      n_files = rng.randint(0, files_per_dir)
 
-  dir_name = f"dir_{level}_{rng.randint(0, 9999):04d}"
-  items: List[Union[Tree, str]] = []
-  items.extend(_build_file_names(n_files, file_exts, f"file_{level}"))
+    dir_name = f"dir_{crt_level}_{rng.randint(0, 9999):04d}"
+    items: List[Union[Tree, str, None]] = _build_file_names(n_files, file_exts, f"file_{crt_level}")
 
-  if depth > 1:
-    for _ in range(n_dirs):
-      items.append(generate_tree(depth - 1, dirs_per_level, files_per_dir,
-                                 file_exts, full_breadth, rng, level + 1))
+    if crt_depth > 1 and n_dirs > 0:
+      first = len(items)
+      items.extend([None] * n_dirs)  # filled in when the children are popped
+      for i in reversed(range(n_dirs)):
+        stack.append((crt_depth - 1, crt_level + 1, items, first + i))
 
-  return {dir_name: items}
+    parent[slot] = {dir_name: items}
+  return root[0]
 
 
 def main() -> int:
@@ -292,13 +328,14 @@ def main() -> int:
   # print(f"repo_root: {repo_root}")
   # exit(-1)
 
-  # Drop any previously imported naeural_core to force local reload
-  for mod in list(sys.modules.keys()):
-    if mod == "naeural_core" or mod.startswith("naeural_core."):
-      del sys.modules[mod]
-
+  # Drop any previously imported naeural_core to force local reload.
+  # Entries are deleted in place: rebinding `sys.modules` would not affect the import system.
+  stale_modules = [mod for mod in sys.modules if mod.partition(".")[0] == "naeural_core"]
+  for mod in stale_modules:
+    del sys.modules[mod]
 
   # Ensure local repo has priority over any installed package
+  orig_sys_path = sys.path[:]
   if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
 
@@ -341,10 +378,15 @@ def main() -> int:
 
   # Create fake plugin modules
   fake_signatures = generate_signatures(args.unique_signatures)
-  for sig in fake_signatures:
-    write_plugin_module(plugin_dir, sig, ct.PLUGIN_SEARCH.SUFFIX_BIZ_PLUGINS,
-                        use_base_plugin=args.use_base_plugin,
-                        use_cv_plugin=args.use_cv_plugin)
+  plugin_suffix = ct.PLUGIN_SEARCH.SUFFIX_BIZ_PLUGINS
+  # Module writes are independent small I/O calls, so they are overlapped on a thread pool.
+  with ThreadPoolExecutor(max_workers=_MAX_WRITE_WORKERS) as executor:
+    list(executor.map(
+      lambda sig: write_plugin_module(plugin_dir, sig, plugin_suffix,
+                                      use_base_plugin=args.use_base_plugin,
+                                      use_cv_plugin=args.use_cv_plugin),
+      fake_signatures,
+    ))
   print(f"Generated fake plugin modules: {len(fake_signatures)}")
 
   real_signatures = parse_signatures_csv(args.real_signatures)
@@ -359,9 +401,10 @@ def main() -> int:
   else:
     all_signatures = list(fake_signatures)
 
-  # Prepare environment: ensure both repo root and temp base are importable
-  sys.path.insert(0, repo_root)
-  sys.path.insert(0, base_dir)
+  # Prepare environment: repo root is already on sys.path, make the temp base importable.
+  # No duplicate entries: every import during _check_instances walks sys.path linearly.
+  if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
 
   # For local filesystem scanning, _get_plugin_by_name uses os.walk on relative paths.
   # We temporarily switch cwd to base_dir so it can discover fake_biz_plugins.
@@ -418,6 +461,7 @@ def main() -> int:
     ct.PLUGIN_SEARCH.LOC_BIZ_PLUGINS = orig_loc
     ct.PLUGIN_SEARCH.SAFE_BIZ_PLUGINS = orig_safe
     os.chdir(orig_cwd)
+    sys.path[:] = orig_sys_path
     if not args.keep:
       shutil.rmtree(base_dir, ignore_errors=True)
 
@@ -1,5 +1,11 @@
+import atexit
+import concurrent.futures
+import multiprocessing as mp
 import os
+import queue
+import shutil
 import sys
+import tempfile
 import threading
 import time
 from collections import deque
@@ -12,7 +18,20 @@ if REPO_ROOT not in sys.path:
 
 from naeural_core import Logger
 from naeural_core.constants import HB, PAYLOAD_DATA
-from naeural_core.main.net_mon import NetworkMonitor, NETMON_MUTEX, UNUSEFULL_HB_KEYS
+from naeural_core.main.net_mon import NetworkMonitor, NETMON_MUTEX, UNUSEFULL_HB_KEYS_SET
+
+
+# local-time string refreshed at most once per millisecond for the writer loop
+_TS_CACHE = {"t": 0.0, "s": ""}
+_TS_CACHE_TTL = 0.001
+
+
+def _fast_now_str():
+  now = time.monotonic()
+  if now - _TS_CACHE["t"] > _TS_CACHE_TTL:
+    _TS_CACHE["s"] = dt.now().strftime(HB.TIMESTAMP_FORMAT)
+    _TS_CACHE["t"] = now
+  return _TS_CACHE["s"]
 
 
 class DummyEpochManager:
@@ -26,41 +45,51 @@ class UnsafeNetworkMonitor(NetworkMonitor):
   """
   def unsafe_register_heartbeat(self, addr, data, sleep_between=0.0005):
     # mimic NetworkMonitor.register_heartbeat + old __register_heartbeat body
-    data[HB.RECEIVED_TIME] = dt.now().strftime(HB.TIMESTAMP_FORMAT)
+    data[HB.RECEIVED_TIME] = _fast_now_str()
 
     if HB.ENCODED_DATA in data:
       str_data = data.pop(HB.ENCODED_DATA)
       dct_hb = self.log.decompress_text(str_data)
-      data = {
-        **data,
-        **dct_hb,
-      }
+      # data is already being mutated in place (old behavior), so merge into it
+      data.update(dct_hb)
 
     __addr_no_prefix = self._NetworkMonitor__remove_address_prefix(addr)
 
-    for key_to_delete in UNUSEFULL_HB_KEYS:
-      data.pop(key_to_delete, None)
+    data = {k: v for k, v in data.items() if k not in UNUSEFULL_HB_KEYS_SET}
 
     with self.log.managed_lock_resource(NETMON_MUTEX):
-      if __addr_no_prefix not in self._NetworkMonitor__network_heartbeats:
-        self._NetworkMonitor__network_heartbeats[__addr_no_prefix] = deque(maxlen=self.HB_HISTORY)
+      store = self._NetworkMonitor__network_heartbeats
+      hb_deque = store.get(__addr_no_prefix)
+      if hb_deque is None:
+        hb_deque = store[__addr_no_prefix] = deque(maxlen=self.HB_HISTORY)
       # append shared dict
-      self._NetworkMonitor__network_heartbeats[__addr_no_prefix].append(data)
+      hb_deque.append(data)
       # widen race window
       time.sleep(sleep_between)
       # mutate stored dict in place (old behavior)
       self._NetworkMonitor__maybe_register_hb_pipelines(addr, data)
       # mutate previous hb in place (old behavior)
-      if len(self._NetworkMonitor__network_heartbeats[__addr_no_prefix]) >= 2:
-        self._NetworkMonitor__pop_repeating_info_from_heartbeat(
-          self._NetworkMonitor__network_heartbeats[__addr_no_prefix][-2]
-        )
+      if len(hb_deque) >= 2:
+        self._NetworkMonitor__pop_repeating_info_from_heartbeat(hb_deque[-2])
+
+
+# the real block engine writes its key (_pk.pem) and authorized_addrs under the
+# logger base folder, so runs use a throw-away folder instead of the cwd
+_LOG_BASE_FOLDER = None
+
+
+def _get_log_base_folder():
+  global _LOG_BASE_FOLDER
+  if _LOG_BASE_FOLDER is None:
+    _LOG_BASE_FOLDER = tempfile.mkdtemp(prefix="nmon_race_")
+    atexit.register(shutil.rmtree, _LOG_BASE_FOLDER, ignore_errors=True)
+  return _LOG_BASE_FOLDER
 
 
 def _make_logger():
   return Logger(
     lib_name="NMON_TEST",
-    base_folder=".",
+    base_folder=_get_log_base_folder(),
     app_folder="_local_cache",
     no_folders_no_save=True,
     max_lines=50,
@@ -68,27 +97,120 @@ def _make_logger():
   )
 
 
+_NODETAG_DC = f"{HB.PREFIX_EE_NODETAG}DC"
+_NODETAG_REG = f"{HB.PREFIX_EE_NODETAG}REG"
+
+# inflated heartbeat templates keyed by extra_keys, copied by _make_hb
+_HB_TEMPLATES = {}
+
+
+def _get_hb_template(extra_keys):
+  template = _HB_TEMPLATES.get(extra_keys)
+  if template is None:
+    template = {
+      HB.EE_ADDR: None,
+      HB.CURRENT_TIME: None,
+      PAYLOAD_DATA.EE_TIMESTAMP: None,
+      PAYLOAD_DATA.EE_TIMEZONE: "UTC",
+      _NODETAG_DC: "TEST_DC",
+      _NODETAG_REG: "EU",
+    }
+    # inflate dict to slow deepcopy and increase race probability
+    template.update({f"K{i}": i for i in range(extra_keys)})
+    _HB_TEMPLATES[extra_keys] = template
+  return template
+
+
 def _make_hb(addr, extra_keys=500):
-  hb = {
-    HB.EE_ADDR: addr,
-    HB.CURRENT_TIME: dt.now().strftime(HB.TIMESTAMP_FORMAT),
-    PAYLOAD_DATA.EE_TIMESTAMP: dt.utcnow().strftime(HB.TIMESTAMP_FORMAT),
-    PAYLOAD_DATA.EE_TIMEZONE: "UTC",
-    f"{HB.PREFIX_EE_NODETAG}DC": "TEST_DC",
-    f"{HB.PREFIX_EE_NODETAG}REG": "EU",
-  }
-  # inflate dict to slow deepcopy and increase race probability
-  for i in range(extra_keys):
-    hb[f"K{i}"] = i
+  hb = _get_hb_template(extra_keys).copy()
+  hb[HB.EE_ADDR] = addr
+  hb[HB.CURRENT_TIME] = _fast_now_str()
+  # EE_TIMESTAMP stays exact: netmon uses it to drop duplicated deliveries
+  hb[PAYLOAD_DATA.EE_TIMESTAMP] = dt.utcnow().strftime(HB.TIMESTAMP_FORMAT)
   return hb
 
 
-def _run_race(netmon, addr, writer_fn, duration_sec=2.0):
+# reader/writer loops only poll the stop flag and deadline every N iterations;
+# writer iterations are far heavier (a full registration), so it polls more
+# often to stop within milliseconds once the reader has captured an error
+_STOP_CHECK_MASK = 0xFF
+_WRITER_STOP_CHECK_MASK = 0x0F
+
+
+# process mode: bounded hand-off queue between producers and the netmon owner
+_PROCESS_QUEUE_SIZE = 256
+_PROCESS_QUEUE_POLL_SEC = 0.05
+
+
+def _hb_producer(addr, hb_queue, mp_stop):
+  """Generate heartbeats in a separate process (see `_run_race(use_processes=True)`)."""
+  # exit without waiting for buffered heartbeats the consumer will never read
+  hb_queue.cancel_join_thread()
+  while not mp_stop.is_set():
+    hb = _make_hb(addr)
+    while not mp_stop.is_set():
+      try:
+        hb_queue.put(hb, timeout=_PROCESS_QUEUE_POLL_SEC)
+        break
+      except queue.Full:
+        continue
+  return
+
+
+# reader/writer workers are reused across _run_race calls
+_POOL = None
+_POOL_MAX_WORKERS = 4
+
+
+def _get_pool():
+  global _POOL
+  if _POOL is None:
+    _POOL = concurrent.futures.ThreadPoolExecutor(
+      max_workers=_POOL_MAX_WORKERS, thread_name_prefix="nmon_race",
+    )
+    atexit.register(_POOL.shutdown, wait=False)
+  return _POOL
+
+
+def _run_race(netmon, addr, writer_fn, duration_sec=2.0, use_processes=False, n_producers=2):
+  """
+  Hammer `netmon` with a reader thread and a writer for `duration_sec`.
+
+  With `use_processes=True` heartbeat generation moves to `n_producers`
+  processes feeding a `multiprocessing.Queue`; the writer thread in this
+  process (which owns `netmon`) only drains the queue into `writer_fn`.
+  The default thread-only mode is the correctness test, the process mode is
+  meant for throughput studies where heartbeat construction would otherwise
+  compete for the GIL with registration.
+
+  The node `addr` must already be registered in `netmon` (seed it with one
+  heartbeat first): the reader starts right away and `get_network_node_tags`
+  raises for an unknown node, which in process mode would otherwise be
+  reported as a failure while the first queued heartbeat is still in flight.
+  """
+  # Event.is_set() is a plain attribute read in CPython (no lock); the Event is
+  # kept over a ctypes flag because the main thread needs its blocking wait()
   stop = threading.Event()
   error = {"exc": None}
+  deadline = time.monotonic() + duration_sec
+  producers = []
+  hb_queue = None
+  if use_processes:
+    mp_stop = mp.Event()
+    hb_queue = mp.Queue(maxsize=_PROCESS_QUEUE_SIZE)
+    producers = [
+      mp.Process(target=_hb_producer, args=(addr, hb_queue, mp_stop), daemon=True)
+      for _ in range(n_producers)
+    ]
+    for proc in producers:
+      proc.start()
 
   def reader():
-    while not stop.is_set():
+    i = 0
+    while True:
+      if (i & _STOP_CHECK_MASK) == 0 and (stop.is_set() or time.monotonic() >= deadline):
+        break
+      i += 1
       try:
         netmon.get_network_node_tags(addr)
       except Exception as exc:  # capture RuntimeError
@@ -97,23 +219,60 @@ def _run_race(netmon, addr, writer_fn, duration_sec=2.0):
         return
 
   def writer():
-    while not stop.is_set():
-      hb = _make_hb(addr)
+    i = 0
+    while True:
+      if (i & _WRITER_STOP_CHECK_MASK) == 0 and (stop.is_set() or time.monotonic() >= deadline):
+        break
+      i += 1
+      if hb_queue is None:
+        # a fresh dict per iteration is required (netmon keeps it, and the
+        # unsafe path stores it as-is) and each needs its own EE_TIMESTAMP or
+        # the fixed path drops it as a duplicate; _make_hb is a template copy
+        hb = _make_hb(addr)
+      else:
+        try:
+          hb = hb_queue.get(timeout=_PROCESS_QUEUE_POLL_SEC)
+        except queue.Empty:
+          i = 0  # re-check stop/deadline right away
+          continue
       writer_fn(addr, hb)
 
-  t_r = threading.Thread(target=reader, daemon=True)
-  t_w = threading.Thread(target=writer, daemon=True)
-  t_r.start()
-  t_w.start()
+  pool = _get_pool()
+  fut_r = pool.submit(reader)
+  fut_w = pool.submit(writer)
 
+  # returns as soon as the reader sets `stop` on a captured exception, so a
+  # failing run ends early while a clean run covers the whole window
   stop.wait(duration_sec)
   stop.set()
-  t_r.join(timeout=1.0)
-  t_w.join(timeout=1.0)
+  concurrent.futures.wait([fut_r, fut_w], timeout=1.0)
+  if producers:
+    mp_stop.set()
+    for proc in producers:
+      proc.join(timeout=1.0)
+      if proc.is_alive():
+        proc.terminate()
+    # do not block interpreter exit on heartbeats still buffered in the queue
+    hb_queue.cancel_join_thread()
+    hb_queue.close()
 
   return error["exc"]
 
 
+def _make_batching_writer(netmon, batch_size=16):
+  """Writer for `_run_race` that flushes every `batch_size` heartbeats via `register_heartbeats`."""
+  pending = []
+
+  def writer_fn(addr, hb):
+    pending.append((addr, hb))
+    if len(pending) >= batch_size:
+      netmon.register_heartbeats(pending)
+      pending.clear()
+    return
+
+  return writer_fn
+
+
 def test_race_repro_old_behavior():
   log = _make_logger()
   netmon = UnsafeNetworkMonitor(
@@ -166,6 +325,63 @@ def test_race_fixed_behavior():
     raise AssertionError(f"Did not expect exception with fixed behavior: {exc}")
 
 
+def test_race_fixed_batched_behavior():
+  log = _make_logger()
+  netmon = NetworkMonitor(
+    log=log,
+    node_name="test_node",
+    node_addr="aixp_test_node",
+    epoch_manager=DummyEpochManager(),
+  )
+  addr = "aixp_test_node"
+
+  # seed with one heartbeat
+  netmon.register_heartbeat(addr, _make_hb(addr))
+
+  exc = _run_race(
+    netmon=netmon,
+    addr=addr,
+    writer_fn=_make_batching_writer(netmon),
+    duration_sec=2.0,
+  )
+
+  if exc is not None:
+    raise AssertionError(f"Did not expect exception with batched registration: {exc}")
+
+
+def test_race_fixed_behavior_processes():
+  log = _make_logger()
+  netmon = NetworkMonitor(
+    log=log,
+    node_name="test_node",
+    node_addr="aixp_test_node",
+    epoch_manager=DummyEpochManager(),
+  )
+  addr = "aixp_test_node"
+
+  # seed with one heartbeat (required before `_run_race`, see its docstring)
+  netmon.register_heartbeat(addr, _make_hb(addr))
+  received = [0]
+
+  def writer_fn(addr, hb):
+    received[0] += 1
+    netmon.register_heartbeat(addr, hb)
+    return
+
+  exc = _run_race(
+    netmon=netmon,
+    addr=addr,
+    writer_fn=writer_fn,
+    duration_sec=2.0,
+    use_processes=True,
+  )
+
+  if exc is not None:
+    raise AssertionError(f"Did not expect exception with process producers: {exc}")
+  if received[0] == 0:
+    raise AssertionError("No heartbeat was received from the producer processes")
+
+
 def main():
   # Ensure we are importing from the local workspace, not a site-packages install.
   import naeural_core as _nc
@@ -174,6 +390,8 @@ def main():
   tests = [
     test_race_repro_old_behavior,
     test_race_fixed_behavior,
+    test_race_fixed_batched_behavior,
+    test_race_fixed_behavior_processes,
   ]
   failures = 0
   for test in tests: